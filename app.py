@@ -1,20 +1,188 @@
 import streamlit as st
+import os
+import json
+import time
+import io
+import uuid
+import sqlite3
+import queue
+import random
+import hashlib
+import logging
+import threading
+import multiprocessing
+import asyncio
+import contextvars
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
 from datetime import datetime, timedelta
-from wordcloud import WordCloud, STOPWORDS
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import closing, contextmanager
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+from wordcloud import STOPWORDS
 import matplotlib.pyplot as plt
 import google.generativeai as genai
 import numpy as np
 from matplotlib.dates import DateFormatter
 from googletrans import Translator
+from wordcloud_worker import render_wordcloud_png
+from prometheus_client import CollectorRegistry, Counter, Histogram, start_http_server
 
-BASE_URL = "https://api.gdeltproject.org/api/v2/doc/doc"
+try:
+    import orjson
+except ImportError:  # optional faster JSON backend
+    orjson = None
+
+# Override with GDELT_BASE_URL to point at a stand-in server (see benchmarks/gdelt_standin.py)
+BASE_URL = os.environ.get("GDELT_BASE_URL", "https://api.gdeltproject.org/api/v2/doc/doc")
+
+# Search windows are snapped to this granularity so identical searches share cache keys.
+# GDELT updates every 15 minutes; use timedelta(hours=1) for coarser reuse or None to disable.
+WINDOW_GRANULARITY_OPTIONS = {
+    '15 minutes': timedelta(minutes=15),
+    '1 hour': timedelta(hours=1),
+}
+WINDOW_GRANULARITY = WINDOW_GRANULARITY_OPTIONS['15 minutes']
+
+# Headline translation for the word cloud
+TRANSLATION_TARGET = 'en'
+TRANSLATION_BATCH_SIZE = 50
+TRANSLATION_CACHE_TTL = 30 * 24 * 60 * 60
+TERM_FREQUENCY_CACHE_TTL = 24 * 60 * 60
+TERM_FREQUENCY_CACHE_MAX_ENTRIES = 1024
+SQLITE_MAX_VARIABLES = 500  # keys per IN (...) lookup
+
+# Word clouds are rendered to PNG in a bounded process pool and cached per process
+WORDCLOUD_RENDER_WORKERS = 2
+WORDCLOUD_CACHE_MAX_ENTRIES = 256
+WORDCLOUD_SIZE = (800, 400)
+
+# Gemini summaries are generated on worker threads and streamed into the page
+SUMMARY_WORKERS = 4
+SUMMARY_PROMPT_VERSION = 2  # bump whenever SUMMARY_PROMPT_TEMPLATE or the article list format changes
+SUMMARY_PROMPT_TEMPLATE = (
+    "Summarize significant events related to the search for '{query}' "
+    "from {start_date} to {end_date}. Here are the top articles: {articles}. "
+)
+
+# Summaries are cached per article set. A cached summary of the same query is also reused for an
+# article set whose URLs overlap it by at least this Jaccard similarity; None requires an exact match.
+SUMMARY_CACHE_TTL = 6 * 60 * 60
+SUMMARY_REUSE_MIN_OVERLAP = 0.9
+SUMMARY_REUSE_CANDIDATES = 20  # most recent summaries of the query compared for overlap
+
+# The summary prompt lists one line per story: near-duplicate headlines (syndicated copies) are
+# collapsed by word-set similarity, stories are ranked by copies and recency, and the list is cut
+# to a token budget
+SUMMARY_PROMPT_TOKEN_BUDGET = 8000
+SUMMARY_CHARS_PER_TOKEN = 4  # rough estimate for English text
+# A trailing " - Reuters" or " | AP News" is only ignored when it names the article's own domain
+TITLE_SOURCE_SUFFIX = r"\s+[-|–—]\s+((?:\S+\s*){1,4})$"
+TITLE_WIRE_PREFIX = r"^(?:UPDATE\s*\d*|EXCLUSIVE|CORRECTED|REFILE|RPT)\s*-\s*"  # "UPDATE 2-", "EXCLUSIVE-"
+NEAR_DUPLICATE_MIN_JACCARD = 0.7  # similarity of near-duplicate headlines' word and word-pair sets
+MINHASH_PERMUTATIONS = 64
+MINHASH_BANDS = 16  # LSH bands of MINHASH_PERMUTATIONS // MINHASH_BANDS rows each
+
+# Headline terms: words starting with a letter, as WordCloud's own tokenizer splits them
+TERM_PATTERN = r"[^\W\d_][\w']+"
+TERM_MIN_LENGTH = 3
+TERM_STOPWORDS = frozenset(STOPWORDS)
+
+# Per-search performance spans are logged as JSON lines to this logger
+PERF_LOGGER_NAME = "gdelt_dashboard.perf"
+
+# Prometheus metrics are exported on this local port; set GDELT_METRICS_PORT=0 to disable the exporter
+METRICS_PORT = int(os.environ.get("GDELT_METRICS_PORT", 9464))
+
+# GDELT returns at most this many articles per artlist request
+GDELT_MAX_RECORDS = 250
+
+# Sharded article retrieval: windows that saturate at GDELT_MAX_RECORDS are bisected
+ARTLIST_MAX_ARTICLES = 1000
+ARTLIST_INITIAL_SHARDS = 4
+ARTLIST_MIN_SHARD = timedelta(minutes=15)
+ARTLIST_SHARD_WORKERS = 4
+
+# Per-term query planning: at most this many terms are fetched, by this many concurrent searches
+TERM_QUERY_MAX_TERMS = 5
+TERM_QUERY_WORKERS = 2
+
+# In-memory memoization of prepared search results (per process)
+SEARCH_CACHE_TTL = 15 * 60
+SEARCH_CACHE_MAX_ENTRIES = 128
+
+# Materialized per-search results kept for incremental refresh (per process)
+MATERIALIZED_MAX_ENTRIES = 64
+
+# HTTP connection pool settings shared by every GDELT call in this process
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 16
+HTTP_TIMEOUT = (5, 30)  # (connect, read) seconds
+
+# Per-host rate limiting, retry and circuit breaking for GDELT requests
+GDELT_RATE_PER_SECOND = 0.2  # GDELT answers 429 "Please limit requests to one every 5 seconds"
+GDELT_RATE_BURST = 1
+GDELT_MAX_RETRIES = 4
+GDELT_BACKOFF_BASE = 1.0  # seconds, doubled on every retry
+GDELT_BACKOFF_MAX = 30.0
+GDELT_RETRY_STATUSES = {429, 500, 502, 503, 504}
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_SECONDS = 60
+
+# On-disk response cache shared by all Streamlit processes on the host
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+RESPONSE_CACHE_PATH = os.path.join(CACHE_DIR, "gdelt_responses.sqlite")
+RESPONSE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+RESPONSE_CACHE_TTL = {  # seconds, per GDELT mode
+    'artlist': 15 * 60,
+    'timelinevol': 30 * 60,
+    'tonechart': 30 * 60,
+}
+RESPONSE_CACHE_DEFAULT_TTL = 15 * 60
+
+# GDELT timeline dates look like 20241001T000000Z
+GDELT_DATE_FORMAT = '%Y%m%dT%H%M%S%z'
+
+# Response format requested from GDELT: 'json' or 'csv' (parsed by pandas' CSV reader)
+GDELT_RESPONSE_FORMAT = 'json'
+CSV_ENGINE = 'c'  # or 'pyarrow'
+
+# CSV headers (lowercased) mapped to the field names used by the JSON responses
+CSV_COLUMN_NAMES = {
+    'url': 'url',
+    'mobileurl': 'url_mobile',
+    'date': 'seendate',
+    'seendate': 'seendate',
+    'title': 'title',
+    'sharingimage': 'socialimage',
+    'socialimage': 'socialimage',
+    'domain': 'domain',
+    'language': 'language',
+    'sourcecountry': 'sourcecountry',
+}
+
+# Local Parquet store of every article retrieved, partitioned by seendate day
+ARTICLE_STORE_DIR = os.path.join(CACHE_DIR, "articles")
+ARTICLE_STORE_COLUMNS = ['url', 'url_mobile', 'title', 'seendate', 'socialimage', 'domain', 'language', 'sourcecountry', 'query_hash']
+ARTICLE_STORE_COMPACT_FILES = 8  # compact a day partition once it holds this many files
+
+# Typed schema for article DataFrames: low-cardinality columns become categoricals,
+# free text becomes pyarrow-backed strings and seendate is parsed to a datetime
+ARTICLE_SEENDATE_FORMAT = '%Y%m%dT%H%M%SZ'
+ARTICLE_CATEGORY_COLUMNS = ['domain', 'language', 'sourcecountry', 'term']
+ARTICLE_STRING_COLUMNS = ['url', 'url_mobile', 'title', 'socialimage']
 
 def main():
     # Page configuration
     st.set_page_config(page_title="Global News Explorer", page_icon="📰", layout="wide")
     apply_custom_styling()
+    get_render_pool()
 
     # Adding a header and a description for the app
     st.markdown("<h1>📰 Global News Explorer 🌍</h1>", unsafe_allow_html=True)
@@ -40,8 +208,9 @@ def main():
     # Sidebar input
     with st.sidebar:
         st.header("🔍 Search Parameters")
-        keyword_input, lookback_period = get_user_input()
+        keyword_input, lookback_period, split_terms, incremental = get_user_input()
         search_button = st.button("Search Articles")
+        show_performance = st.checkbox("Show performance panel", value=False)
 
     # Configure Generative AI API
     genai.configure(api_key=st.secrets["api_key"])
@@ -52,11 +221,30 @@ def main():
         if len(keyword_input) < 5:
             st.warning("🔍 Please enter at least 5 characters for the keyword.")
         else:
-            query = build_query(keyword_input)
+            perf = PerfRecorder()
+            CURRENT_PERF_RECORDER.set(perf)
+            get_metrics()['searches'].inc()
+
+            with perf_span('build_query'):
+                query, query_hash = normalize_query(keyword_input)
             st.spinner("Retrieving news articles, please wait...")
 
             start_datetime, end_datetime = get_start_date(lookback_period)
-            articles_df, timeline_df, tone_df = aggregate_gdelt_data(query, start_datetime, end_datetime)
+            term_results = None
+            term_index = None
+            with perf_span('fetch', lookback=lookback_period) as span:
+                if split_terms and len(canonicalize_keywords(keyword_input)) > 1:
+                    skipped_terms = canonicalize_keywords(keyword_input)[TERM_QUERY_MAX_TERMS:]
+                    if skipped_terms:
+                        st.warning(f"✂️ Only {TERM_QUERY_MAX_TERMS} terms are searched separately; "
+                                   f"left out: {', '.join(skipped_terms)}.")
+                    articles_df, timeline_df, tone_df, term_results = aggregate_by_term(keyword_input, start_datetime, end_datetime)
+                elif incremental:
+                    articles_df, timeline_df, tone_df = refresh_search_results(query, lookback_period, start_datetime, end_datetime)
+                    term_index = get_term_index(query_hash, lookback_period)
+                else:
+                    articles_df, timeline_df, tone_df = load_search_results(query, start_datetime, end_datetime)
+                span.update(articles=len(articles_df), timeline_points=len(timeline_df), tone_bins=len(tone_df))
 
             # Descriptive text about the results
             st.markdown(f"### Results for '{keyword_input.replace(';', ' OR ')}'")
@@ -64,14 +252,27 @@ def main():
 
             # Display results if available
             if not articles_df.empty:
-                display_summary(model, query, start_datetime.strftime('%Y-%m-%d'), end_datetime.strftime('%Y-%m-%d'), articles_df)
-                display_wordcloud(articles_df)
-                display_timeline(timeline_df)
-                display_tone_chart(tone_df)
-                display_article_headlines(articles_df)
+                with perf_span('summary', articles=len(articles_df)):
+                    summary = display_summary(model, query, start_datetime.strftime('%Y-%m-%d'), end_datetime.strftime('%Y-%m-%d'), articles_df)
+                with perf_span('wordcloud', articles=len(articles_df)):
+                    display_wordcloud(articles_df, term_index)
+                with perf_span('timeline_chart', points=len(timeline_df)):
+                    display_timeline(timeline_df)
+                with perf_span('tone_chart', bins=len(tone_df)):
+                    display_tone_chart(tone_df)
+                if term_results:
+                    display_term_breakdown(term_results)
+                with perf_span('headlines', articles=len(articles_df)):
+                    display_article_headlines(articles_df)
+                with perf_span('summary_stream'):
+                    summary.render()
             else:
                 st.warning("🤔 No articles found for the given search parameters.")
 
+            perf.log_summary(query=query, query_hash=query_hash, lookback=lookback_period)
+            if show_performance:
+                display_performance(perf)
+
 def ensure_keyword_in_quotes(keyword):
     """
     Ensure each keyword or keyphrase is enclosed in double quotes unless it's already quoted.
@@ -81,8 +282,23 @@ def ensure_keyword_in_quotes(keyword):
         keyword = f'"{keyword}"'
     return keyword
 
-def get_start_date(lookback_period):
+def quantize_datetime(value, granularity):
+    """
+    Snap a datetime down to the start of its granularity bucket (e.g. 15 minutes or 1 hour).
+    """
+    return datetime.min + ((value - datetime.min) // granularity) * granularity
+
+
+def get_start_date(lookback_period, granularity=WINDOW_GRANULARITY):
+    """
+    Compute the search window ending now.
+    With a granularity set, the end is snapped down to that bucket (and the start with it), so
+    repeated searches within the same bucket produce identical GDELT requests and cache keys.
+    Pass granularity=None for an unquantized window anchored on the current second.
+    """
     end_datetime = datetime.now()
+    if granularity:
+        end_datetime = quantize_datetime(end_datetime, granularity)
     if lookback_period == '1 week':
         start_datetime = end_datetime - timedelta(weeks=1)
     elif lookback_period == '1 month':
@@ -135,14 +351,552 @@ def get_user_input():
     keyword_input = st.text_input("Enter Keywords (semicolon-separated)", "Climate Change; Global Warming; Greenhouse Effect")
     lookback_options = ["1 week", "1 month", "3 months", "6 months", "1 year"]
     lookback_period = st.selectbox("Choose Lookback Period", lookback_options, index=1)
-    return keyword_input, lookback_period
+    split_terms = st.checkbox("Query each keyword separately", value=False,
+                              help="Fetch every keyword on its own so one dominant term does not crowd out the others.")
+    incremental = st.checkbox("Incremental refresh", value=True,
+                              help="Re-use the previous results of this search and only fetch what is new since then.")
+    return keyword_input, lookback_period, split_terms, incremental
+
+
+@st.cache_resource
+def get_metrics():
+    """
+    Create the process-wide Prometheus metrics and start the text-format exporter.
+    Only the first Streamlit process on a host can bind METRICS_PORT; the others still record metrics.
+    """
+    registry = CollectorRegistry()
+    metrics = {
+        'searches': Counter('gdelt_dashboard_searches_total', 'Searches submitted', registry=registry),
+        'gdelt_latency': Histogram('gdelt_dashboard_gdelt_request_seconds', 'GDELT HTTP request latency',
+                                   ['mode'], registry=registry),
+        'gdelt_responses': Counter('gdelt_dashboard_gdelt_responses_total', 'GDELT responses by status code',
+                                   ['mode', 'status'], registry=registry),
+        'cache_lookups': Counter('gdelt_dashboard_response_cache_lookups_total', 'Response cache lookups',
+                                 ['result'], registry=registry),
+        'summary_cache_lookups': Counter('gdelt_dashboard_summary_cache_lookups_total', 'Gemini summary cache lookups',
+                                         ['result'], registry=registry),
+        'stage_latency': Histogram('gdelt_dashboard_stage_seconds', 'Duration of dashboard stages '
+                                   '(fetch, gemini, translate, wordcloud and chart rendering)',
+                                   ['stage'], registry=registry),
+    }
+    if METRICS_PORT:
+        try:
+            start_http_server(METRICS_PORT, addr="127.0.0.1", registry=registry)
+        except OSError:
+            pass
+    return metrics
+
+
+class PerfRecorder:
+    """
+    Collects timed spans and counters for one search.
+    Each finished span is also emitted as a structured JSON log line.
+    """
+
+    def __init__(self):
+        self.spans = []
+        self.counters = {}
+        self.started = time.perf_counter()
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name, **attributes):
+        record = dict(attributes)
+        wall_start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            yield record
+        finally:
+            record = {
+                'span': name,
+                'duration_ms': round((time.perf_counter() - wall_start) * 1000, 1),
+                'thread_cpu_ms': round((time.thread_time() - cpu_start) * 1000, 1),
+                **record,
+            }
+            with self.lock:
+                self.spans.append(record)
+            get_perf_logger().info(json.dumps(record, default=str))
+
+    def count(self, name, value=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def log_summary(self, **attributes):
+        get_perf_logger().info(json.dumps({
+            'event': 'search',
+            'total_ms': round((time.perf_counter() - self.started) * 1000, 1),
+            **self.counters,
+            **attributes,
+        }, default=str))
+
+
+CURRENT_PERF_RECORDER = contextvars.ContextVar("perf_recorder", default=None)
+
+
+def get_perf_logger():
+    logger = logging.getLogger(PERF_LOGGER_NAME)
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+
+@contextmanager
+def perf_span(name, **attributes):
+    """
+    Time a stage into the stage latency histogram and, during a recorded search, its recorder.
+    """
+    recorder = CURRENT_PERF_RECORDER.get()
+    start = time.perf_counter()
+    try:
+        if recorder is None:
+            yield dict(attributes)
+        else:
+            with recorder.span(name, **attributes) as record:
+                yield record
+    finally:
+        get_metrics()['stage_latency'].labels(stage=name).observe(time.perf_counter() - start)
+
+
+def perf_count(name, value=1):
+    recorder = CURRENT_PERF_RECORDER.get()
+    if recorder is not None:
+        recorder.count(name, value)
+
+
+def submit_in_context(executor, fn, *args):
+    """
+    Submit work to an executor so it still reports to the current search's recorder.
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args)
+
+
+@st.cache_resource
+def get_http_session():
+    """
+    Create the process-wide HTTP session used for all GDELT requests.
+    Cached as a Streamlit resource so every script run and every user session reuses
+    the same keep-alive connection pool instead of opening a new TLS connection per call.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+    })
+    return session
+
+
+@st.cache_resource
+def init_response_cache(path):
+    """
+    Create the SQLite cache schema once per process and database file.
+    WAL mode is persistent in the file and lets several Streamlit worker processes read and write
+    it concurrently.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with closing(sqlite3.connect(path, timeout=30)) as conn, conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                mode TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        conn.execute("CREATE TABLE IF NOT EXISTS cache_stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS translations (
+                title_hash TEXT NOT NULL,
+                dest TEXT NOT NULL,
+                text TEXT NOT NULL,
+                created REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (title_hash, dest)
+            )
+        """)
+        if 'created' not in {column[1] for column in conn.execute("PRAGMA table_info(translations)")}:
+            # Caches written before translations expired; their rows count as expired
+            conn.execute("ALTER TABLE translations ADD COLUMN created REAL NOT NULL DEFAULT 0")
+        conn.execute("CREATE TABLE IF NOT EXISTS term_frequencies (key TEXT PRIMARY KEY, body BLOB NOT NULL, created REAL NOT NULL)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS summaries (
+                key TEXT PRIMARY KEY,
+                scope TEXT NOT NULL,
+                urls BLOB NOT NULL,
+                text TEXT NOT NULL,
+                created REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS summaries_scope ON summaries (scope, created)")
+    return path
+
+
+def connect_response_cache():
+    """
+    Open a connection to the SQLite response cache, creating the schema on first use.
+    """
+    return sqlite3.connect(init_response_cache(RESPONSE_CACHE_PATH), timeout=30)
+
+
+def response_cache_key(params):
+    """
+    Content-address a GDELT request by hashing its canonical (sorted) parameters.
+    """
+    canonical = json.dumps({'url': BASE_URL, 'params': params}, sort_keys=True)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def bump_cache_stat(conn, name):
+    conn.execute(
+        "INSERT INTO cache_stats (name, value) VALUES (?, 1) "
+        "ON CONFLICT(name) DO UPDATE SET value = value + 1",
+        (name,),
+    )
+
+
+def cache_get(key, mode, allow_stale=False):
+    """
+    Return the cached response body for a key, or None if it is missing or older than the mode's TTL.
+    With allow_stale=True the TTL is ignored; used to keep serving data while GDELT is unavailable,
+    after a regular lookup has already missed, so an absent entry is not counted as a second miss.
+    """
+    ttl = RESPONSE_CACHE_TTL.get(mode, RESPONSE_CACHE_DEFAULT_TTL)
+    now = time.time()
+    try:
+        with closing(connect_response_cache()) as conn, conn:
+            row = conn.execute("SELECT body, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None or (now - row[1] > ttl and not allow_stale):
+                if not allow_stale:  # a stale fallback lookup follows a miss already counted
+                    bump_cache_stat(conn, 'misses')
+                    perf_count('cache_misses')
+                    get_metrics()['cache_lookups'].labels(result='miss').inc()
+                return None
+            conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            bump_cache_stat(conn, 'stale_hits' if now - row[1] > ttl else 'hits')
+            perf_count('cache_hits')
+            get_metrics()['cache_lookups'].labels(result='stale_hit' if now - row[1] > ttl else 'hit').inc()
+            return row[0]
+    except sqlite3.Error:
+        return None
+
+
+def cache_put(key, mode, body):
+    """
+    Store a response body and evict least-recently-used entries once the cache exceeds its size cap.
+    """
+    now = time.time()
+    try:
+        with closing(connect_response_cache()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, mode, body, size, created, accessed) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, mode, body, len(body), now, now),
+            )
+            total_size = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total_size > RESPONSE_CACHE_MAX_BYTES:
+                evict = []
+                for old_key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed"):
+                    if total_size <= RESPONSE_CACHE_MAX_BYTES:
+                        break
+                    evict.append((old_key,))
+                    total_size -= size
+                conn.executemany("DELETE FROM responses WHERE key = ?", evict)
+                for _ in evict:
+                    bump_cache_stat(conn, 'evictions')
+    except sqlite3.Error:
+        pass
+
+
+def get_cache_stats():
+    """
+    Return the shared hit/miss/eviction counters together with the current entry count and size.
+    """
+    with closing(connect_response_cache()) as conn:
+        stats = dict(conn.execute("SELECT name, value FROM cache_stats").fetchall())
+        entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+    stats.update({'entries': entries, 'bytes': size})
+    return stats
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: acquire() blocks until a token is available.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_seconds = (1 - self.tokens) / self.rate
+            time.sleep(wait_seconds)
+
+
+class CircuitBreaker:
+    """
+    Stop calling a host after repeated failures and probe it again once the reset period has passed.
+    """
+
+    def __init__(self, failure_threshold, reset_seconds):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at = None
+        self.lock = threading.Lock()
+
+    def allow(self):
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.reset_seconds:
+                # Half-open: let requests through until the next failure re-opens the circuit
+                self.opened_at = None
+                self.failures = self.failure_threshold - 1
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+@st.cache_resource
+def get_rate_limiter(host):
+    """
+    Return the process-wide token bucket for a host, shared by all threads and user sessions.
+    """
+    return TokenBucket(GDELT_RATE_PER_SECOND, GDELT_RATE_BURST)
+
+
+@st.cache_resource
+def get_circuit_breaker(host):
+    """
+    Return the process-wide circuit breaker for a host.
+    """
+    return CircuitBreaker(CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_SECONDS)
+
+
+def retry_after_seconds(response):
+    """
+    Parse a Retry-After header given either as delay seconds or as an HTTP date.
+    """
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def fetch_gdelt_response(params):
+    """
+    Request GDELT under the host's rate limit, retrying 429/5xx responses and connection errors
+    with exponential backoff and jitter (honoring Retry-After when sent).
+    Returns the response body, or None if the request failed or the circuit is open.
+    A request that exhausts its retries counts as one failure towards the host's circuit breaker,
+    unless it was only ever throttled (429), which is not an outage.
+    """
+    host = urlparse(BASE_URL).netloc
+    limiter = get_rate_limiter(host)
+    breaker = get_circuit_breaker(host)
+    metrics = get_metrics()
+    mode = params['mode']
+    outage = False
+
+    for attempt in range(GDELT_MAX_RETRIES + 1):
+        if not breaker.allow():
+            metrics['gdelt_responses'].labels(mode=mode, status='circuit_open').inc()
+            return None
+        limiter.acquire()
+        delay = None
+        request_start = time.perf_counter()
+        try:
+            response = get_http_session().get(BASE_URL, params=params, timeout=HTTP_TIMEOUT)
+        except requests.RequestException:
+            metrics['gdelt_responses'].labels(mode=mode, status='error').inc()
+            outage = True
+        else:
+            metrics['gdelt_latency'].labels(mode=mode).observe(time.perf_counter() - request_start)
+            metrics['gdelt_responses'].labels(mode=mode, status=str(response.status_code)).inc()
+            if response.status_code == 200:
+                breaker.record_success()
+                perf_count('gdelt_requests')
+                perf_count('bytes_downloaded', len(response.content))
+                return response.content
+            if response.status_code not in GDELT_RETRY_STATUSES:
+                return None
+            outage = outage or response.status_code != 429
+            delay = retry_after_seconds(response)
+
+        if attempt == GDELT_MAX_RETRIES:
+            break
+        if delay is None:
+            delay = GDELT_BACKOFF_BASE * 2 ** attempt
+            delay += random.uniform(0, delay)
+        time.sleep(min(delay, GDELT_BACKOFF_MAX))
+    if outage:
+        breaker.record_failure()
+    return None
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls that share a key into a single execution.
+    The first caller runs the function; callers arriving while it is in flight wait for and
+    receive the same result (or exception).
+    """
+
+    def __init__(self):
+        self.calls = {}
+        self.lock = threading.Lock()
+
+    def do(self, key, fn, *args):
+        with self.lock:
+            future = self.calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self.calls[key] = future
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self.lock:
+                del self.calls[key]
+
+
+@st.cache_resource
+def get_single_flight():
+    """
+    Return the process-wide single-flight group used to coalesce identical GDELT requests.
+    """
+    return SingleFlight()
+
+
+def parse_gdelt_json(body):
+    """
+    Parse a GDELT response body, using orjson when it is installed.
+    orjson decodes straight from bytes and builds the result several times faster than the
+    standard library, which matters for large artlist and timelinevolraw payloads.
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def read_gdelt_csv(body):
+    """
+    Read a GDELT CSV response (UTF-8 with a BOM) into a DataFrame with lowercased headers.
+    """
+    frame = pd.read_csv(io.BytesIO(body), encoding='utf-8-sig', engine=CSV_ENGINE)
+    frame.columns = [column.strip().lower() for column in frame.columns]
+    return frame
+
+
+def parse_artlist_csv(body):
+    frame = read_gdelt_csv(body).rename(columns=CSV_COLUMN_NAMES)
+    if 'seendate' in frame.columns:
+        seendate = frame['seendate'].astype(str)
+        if not seendate.str.fullmatch(r'\d{8}T\d{6}Z').all():
+            # Normalize other timestamp layouts to the JSON seendate form used downstream
+            seendate = pd.to_datetime(seendate, utc=True).dt.strftime(ARTICLE_SEENDATE_FORMAT)
+        frame['seendate'] = seendate
+    return frame
+
+
+def parse_timeline_csv(body):
+    return read_gdelt_csv(body)[['date', 'value']]
 
 
-def query_gdelt_data(query, mode, start_datetime=None, end_datetime=None):
+def parse_tonechart_csv(body):
+    return read_gdelt_csv(body)[['bin', 'count']]
+
+
+CSV_PARSERS = {
+    'artlist': parse_artlist_csv,
+    'timelinevol': parse_timeline_csv,
+    'timelinevolraw': parse_timeline_csv,
+    'tonechart': parse_tonechart_csv,
+}
+
+
+def parse_gdelt_response(body, mode, response_format):
+    """
+    Parse a response body: JSON into its dict payload, CSV into a DataFrame via the mode's parser.
+    Raises ValueError for bodies that are not valid in the requested format.
+    """
+    if response_format == 'csv':
+        try:
+            return CSV_PARSERS[mode](body)
+        except (KeyError, pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError) as e:
+            raise ValueError(f"Unparseable GDELT CSV response for mode '{mode}'") from e
+    return parse_gdelt_json(body)
+
+
+def load_gdelt_response(cache_key, mode, params):
+    response_format = params['format']
+    body = cache_get(cache_key, mode)
+    if body is None:
+        body = fetch_gdelt_response(params)
+        if body is None:
+            # GDELT is failing or the circuit is open: fall back to an expired cache entry if there is one
+            stale_body = cache_get(cache_key, mode, allow_stale=True)
+            return parse_gdelt_response(stale_body, mode, response_format) if stale_body is not None else None
+        try:
+            data = parse_gdelt_response(body, mode, response_format)
+        except ValueError:
+            return None
+        cache_put(cache_key, mode, body)
+        return data
+
+    return parse_gdelt_response(body, mode, response_format)
+
+
+def query_gdelt_data(query, mode, start_datetime=None, end_datetime=None, max_records=GDELT_MAX_RECORDS,
+                     response_format='json'):
     params = {
+        'query': query,
         'mode': mode,
-        'format': 'json',
-        'maxrecords': 250,
+        'format': response_format,
+        'maxrecords': max_records,
     }
 
     if start_datetime:
@@ -150,107 +904,1021 @@ def query_gdelt_data(query, mode, start_datetime=None, end_datetime=None):
     if end_datetime:
         params['ENDDATETIME'] = end_datetime.strftime('%Y%m%d%H%M%S')
 
-    request_url = f"{BASE_URL}?query={query}&mode={mode}&format=json&maxrecords=250"
-    if start_datetime:
-        request_url += f"&STARTDATETIME={params['STARTDATETIME']}"
-    if end_datetime:
-        request_url += f"&ENDDATETIME={params['ENDDATETIME']}"
+    # Identical requests from concurrent sessions share one cache lookup and upstream fetch
+    cache_key = response_cache_key(params)
+    return get_single_flight().do(cache_key, load_gdelt_response, cache_key, mode, params)
 
-    response = requests.get(request_url)
 
-    if response.status_code == 200:
-        return response.json()
-    else:
+def query_gdelt_frame(query, mode, start_datetime=None, end_datetime=None, response_format=None):
+    """
+    Fetch one GDELT mode as a DataFrame, independent of the response format on the wire.
+    artlist frames have the JSON article fields, timeline frames 'date'/'value' and tone chart
+    frames 'bin'/'count'. Returns None on failure.
+    """
+    response_format = response_format or GDELT_RESPONSE_FORMAT
+    data = query_gdelt_data(query, mode, start_datetime, end_datetime, response_format=response_format)
+    if data is None:
+        return None
+    if response_format == 'csv':
+        # Parsed frames are shared between coalesced callers, so hand out a private copy
+        return data.copy()
+    return json_payload_to_frame(data, mode)
+
+
+def json_payload_to_frame(data, mode):
+    """
+    Build the per-mode DataFrame from a parsed JSON payload.
+    """
+    if mode == 'artlist':
+        return pd.DataFrame(data.get('articles', []))
+    if mode.startswith('timeline'):
+        timeline = data.get('timeline', [])
+        return pd.DataFrame(timeline[0]['data'] if timeline else [], columns=['date', 'value'])
+    if mode == 'tonechart':
+        return pd.DataFrame(data.get('tonechart', []), columns=['bin', 'count'])
+    raise ValueError(f"No DataFrame builder for GDELT mode '{mode}'")
+
+
+def split_window(start_datetime, end_datetime, parts, min_length=ARTLIST_MIN_SHARD):
+    """
+    Split [start, end] into equal, contiguous sub-windows truncated to whole seconds.
+    The window is split into fewer parts where needed so that none is shorter than min_length;
+    a window of at most min_length stays whole.
+    """
+    parts = max(1, min(parts, (end_datetime - start_datetime) // min_length))
+    step = (end_datetime - start_datetime) / parts
+    edges = [start_datetime + step * i for i in range(parts)] + [end_datetime]
+    edges = [edge.replace(microsecond=0) for edge in edges]
+    return [(edges[i], edges[i + 1]) for i in range(parts) if edges[i] < edges[i + 1]]
+
+
+def fetch_articles_sharded(query, start_datetime, end_datetime, max_articles=None):
+    """
+    Retrieve more than GDELT_MAX_RECORDS articles by sharding the window.
+    The window is split into up to ARTLIST_INITIAL_SHARDS sub-windows of at least ARTLIST_MIN_SHARD
+    (GDELT indexes in 15-minute batches) fetched concurrently by a bounded worker pool; shards that
+    come back full are bisected and their halves fetched as the next level, until shards stop
+    saturating, are too short to bisect, or a completed level brings the total to max_articles
+    unique URLs. The cap is only checked between levels, so the result does not depend on which
+    requests happen to finish first.
+    Returns the articles newest first, or None if every shard failed.
+    """
+    max_articles = max_articles or ARTLIST_MAX_ARTICLES
+    frames = []
+    seen_urls = set()
+    succeeded = False
+
+    with ThreadPoolExecutor(max_workers=ARTLIST_SHARD_WORKERS) as executor:
+        shards = split_window(start_datetime, end_datetime, ARTLIST_INITIAL_SHARDS)
+        while shards and len(seen_urls) < max_articles:
+            futures = [submit_in_context(executor, query_gdelt_frame, query, 'artlist', shard_start, shard_end)
+                       for shard_start, shard_end in shards]
+            next_shards = []
+            for (shard_start, shard_end), future in zip(shards, futures):
+                shard_df = future.result()
+                if shard_df is None:
+                    continue
+                succeeded = True
+                if not shard_df.empty:
+                    frames.append(shard_df)
+                    seen_urls.update(shard_df['url'])
+                if len(shard_df) >= GDELT_MAX_RECORDS and shard_end - shard_start >= 2 * ARTLIST_MIN_SHARD:
+                    next_shards.extend(split_window(shard_start, shard_end, 2))
+            shards = next_shards
+
+    if not succeeded:
         return None
+    if not frames:
+        return pd.DataFrame()
+    articles_df = pd.concat(frames, ignore_index=True).drop_duplicates(subset='url')
+    articles_df = articles_df.sort_values(['seendate', 'url'], ascending=[False, True], kind='stable')
+    return articles_df.head(max_articles).reset_index(drop=True)
+
+
+@st.cache_resource
+def get_article_store_writer():
+    """
+    Single background thread that appends fetched articles to the store off the request path.
+    """
+    return ThreadPoolExecutor(max_workers=1)
+
+
+def article_store_partitioning():
+    return ds.partitioning(pa.schema([('day', pa.string())]), flavor='hive')
+
+
+def write_article_partitions(articles_df, query_hash):
+    """
+    Append articles to the store as one new Parquet file per seendate day.
+    Files are only ever added (never rewritten in place), so concurrent writers from several
+    processes cannot lose rows; duplicates are removed on read and by compaction.
+    """
+    articles_df = articles_df.reindex(columns=ARTICLE_STORE_COLUMNS).assign(query_hash=query_hash).astype('string')
+    for day, day_df in articles_df.groupby(articles_df['seendate'].str[:8]):
+        partition_dir = os.path.join(ARTICLE_STORE_DIR, f"day={day}")
+        os.makedirs(partition_dir, exist_ok=True)
+        temp_path = os.path.join(partition_dir, f".{uuid.uuid4().hex}.tmp")
+        day_df.to_parquet(temp_path, index=False)
+        os.replace(temp_path, os.path.join(partition_dir, f"part-{uuid.uuid4().hex}.parquet"))
+        compact_article_partition(partition_dir)
+
+
+def compact_article_partition(partition_dir):
+    """
+    Merge a day partition's files into one file de-duplicated by (query_hash, url).
+    """
+    paths = [os.path.join(partition_dir, name) for name in os.listdir(partition_dir) if name.endswith('.parquet')]
+    if len(paths) < ARTICLE_STORE_COMPACT_FILES:
+        return
+    merged = pd.concat([pd.read_parquet(path) for path in paths], ignore_index=True)
+    merged = merged.drop_duplicates(subset=['query_hash', 'url'])
+    temp_path = os.path.join(partition_dir, f".{uuid.uuid4().hex}.tmp")
+    merged.to_parquet(temp_path, index=False)
+    os.replace(temp_path, os.path.join(partition_dir, f"part-{uuid.uuid4().hex}.parquet"))
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def store_articles(articles_df, query):
+    """
+    Queue retrieved articles for the local store. Failures never affect the search itself.
+    """
+    if articles_df.empty or 'seendate' not in articles_df.columns:
+        return
+
+    def write():
+        try:
+            write_article_partitions(articles_df, query_fingerprint(query))
+        except (OSError, pa.ArrowException):
+            pass
+
+    get_article_store_writer().submit(write)
+
+
+def read_stored_articles(query, start_datetime, end_datetime):
+    """
+    Read a query's stored articles seen within [start, end], newest first and unique by URL.
+    The day partition and seendate/query filters are pushed down to the Parquet scan.
+    """
+    if not os.path.isdir(ARTICLE_STORE_DIR):
+        return pd.DataFrame()
+    start_seen = start_datetime.strftime('%Y%m%dT%H%M%SZ')
+    end_seen = end_datetime.strftime('%Y%m%dT%H%M%SZ')
+    predicate = (
+        (ds.field('day') >= start_seen[:8]) & (ds.field('day') <= end_seen[:8])
+        & (ds.field('query_hash') == query_fingerprint(query))
+        & (ds.field('seendate') >= start_seen) & (ds.field('seendate') <= end_seen)
+    )
+    try:
+        dataset = ds.dataset(ARTICLE_STORE_DIR, format='parquet', partitioning=article_store_partitioning())
+        articles_df = dataset.to_table(filter=predicate, columns=ARTICLE_STORE_COLUMNS[:-1]).to_pandas()
+    except (OSError, pa.ArrowException):
+        return pd.DataFrame()
+    articles_df = articles_df.drop_duplicates(subset='url').sort_values('seendate', ascending=False)
+    return articles_df.reset_index(drop=True)
+
+
+def apply_article_schema(articles_df):
+    """
+    Convert an article DataFrame to the compact typed schema.
+    Safe to call again on an already typed (or concatenated) frame. The bytes saved relative to
+    the input are recorded in articles_df.attrs['memory_savings'].
+    """
+    if articles_df.empty:
+        return articles_df
+    memory_before = articles_df.memory_usage(deep=True).sum()
+    articles_df = articles_df.copy()
+
+    if 'seendate' in articles_df.columns and not pd.api.types.is_datetime64_any_dtype(articles_df['seendate']):
+        articles_df['seendate'] = pd.to_datetime(articles_df['seendate'], format=ARTICLE_SEENDATE_FORMAT, errors='coerce')
+    for column in ARTICLE_CATEGORY_COLUMNS:
+        if column in articles_df.columns:
+            articles_df[column] = articles_df[column].astype('category')
+    for column in ARTICLE_STRING_COLUMNS:
+        if column in articles_df.columns:
+            articles_df[column] = articles_df[column].astype('string[pyarrow]')
+
+    memory_after = articles_df.memory_usage(deep=True).sum()
+    articles_df.attrs['memory_bytes'] = int(memory_after)
+    articles_df.attrs['memory_savings'] = int(memory_before - memory_after)
+    return articles_df
 
 
-def aggregate_gdelt_data(query, start_datetime, end_datetime):
+def parse_gdelt_dates(dates):
+    """
+    Parse GDELT timeline dates; the JSON form uses GDELT_DATE_FORMAT, CSV may use other layouts.
+    """
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        return dates
+    try:
+        return pd.to_datetime(dates, format=GDELT_DATE_FORMAT)
+    except ValueError:
+        return pd.to_datetime(dates, utc=True)
+
+
+class IncompleteResultError(Exception):
+    """
+    Raised when a GDELT mode could not be fetched; result holds the (articles, timeline, tone)
+    frames that were retrieved, so callers can still show them without caching them.
+    """
+
+    def __init__(self, result):
+        super().__init__("GDELT data is incomplete")
+        self.result = result
+
+
+def aggregate_gdelt_data(query, start_datetime, end_datetime, strict=False, tone_start_datetime=None):
+    """
+    Fetch the timeline, tone chart and article list concurrently.
+    Each mode is requested on its own worker thread, so the total wait is close to
+    the slowest single GDELT call rather than the sum of all three.
+    With strict=True an IncompleteResultError is raised if any mode failed. The tone chart window
+    can start at tone_start_datetime instead, since tone histograms cannot be merged over time.
+    """
     articles_df, timeline_df, tone_df = pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
 
-    timeline_data = query_gdelt_data(query, 'timelinevol', start_datetime, end_datetime)
-    if timeline_data:
-        timeline_df = pd.DataFrame(timeline_data['timeline'][0]['data'])
-        timeline_df['date'] = pd.to_datetime(timeline_df['date'])
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        timeline_future = submit_in_context(executor, query_gdelt_frame, query, 'timelinevol', start_datetime, end_datetime)
+        tone_future = submit_in_context(executor, query_gdelt_frame, query, 'tonechart',
+                                        tone_start_datetime or start_datetime, end_datetime)
+        articles_future = submit_in_context(executor, fetch_articles_sharded, query, start_datetime, end_datetime)
+        timeline_frame = timeline_future.result()
+        tone_frame = tone_future.result()
+        articles_frame = articles_future.result()
+
+    if timeline_frame is not None and not timeline_frame.empty:
+        timeline_df = timeline_frame
+        timeline_df['date'] = parse_gdelt_dates(timeline_df['date'])
         timeline_df['value'] = pd.to_numeric(timeline_df['value'])
         timeline_df['moving_avg'] = timeline_df['value'].rolling(window=7).mean()
 
-    tone_data = query_gdelt_data(query, 'tonechart', start_datetime, end_datetime)
-    if tone_data:
-        tone_df = pd.DataFrame(tone_data['tonechart'])
+    if tone_frame is not None and not tone_frame.empty:
+        tone_df = tone_frame
+
+    if articles_frame is not None and not articles_frame.empty:
+        articles_df = articles_frame
+        store_articles(articles_df, query)
+    else:
+        # GDELT returned nothing usable: serve whatever the local article store has for this window
+        articles_df = read_stored_articles(query, start_datetime, end_datetime)
+
+    result = apply_article_schema(articles_df), timeline_df, tone_df
+    if strict and any(frame is None for frame in (timeline_frame, tone_frame, articles_frame)):
+        raise IncompleteResultError(result)
+    return result
 
-    articles_data = query_gdelt_data(query, 'artlist', start_datetime, end_datetime)
-    if articles_data:
-        articles_df = pd.DataFrame(articles_data['articles'])
+
+@st.cache_data(ttl=SEARCH_CACHE_TTL, max_entries=SEARCH_CACHE_MAX_ENTRIES, show_spinner=False)
+def fetch_search_results(query, start_datetime, end_datetime):
+    """
+    Memoized data-acquisition stage.
+    Keyed on the built query and the quantized window from get_start_date, so reruns and repeat
+    searches within the same window bucket return the prepared DataFrames without any network calls.
+    Raises IncompleteResultError when GDELT failed, which keeps the failure out of the memo.
+    """
+    return aggregate_gdelt_data(query, start_datetime, end_datetime, strict=True)
+
+
+def load_search_results(query, start_datetime, end_datetime):
+    """
+    Return the (articles, timeline, tone) frames for a search, partial if GDELT failed.
+    """
+    try:
+        return fetch_search_results(query, start_datetime, end_datetime)
+    except IncompleteResultError as e:
+        return e.result
+
+
+def merge_term_results(term_results):
+    """
+    Merge per-term (articles, timeline, tone) results into one unified result.
+    Articles are concatenated with a 'term' column and de-duplicated by URL, timeline volumes are
+    summed per date (articles matching several terms are counted once per term), and tone
+    histograms are summed per bin.
+    """
+    articles = [df.assign(term=term) for term, (df, _, _) in term_results.items() if not df.empty]
+    timelines = [df[['date', 'value']] for _, (_, df, _) in term_results.items() if not df.empty]
+    tones = [df[['bin', 'count']] for _, (_, _, df) in term_results.items() if not df.empty]
+
+    articles_df, timeline_df, tone_df = pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+    if articles:
+        articles_df = pd.concat(articles, ignore_index=True).drop_duplicates(subset='url', ignore_index=True)
+        articles_df = apply_article_schema(articles_df)
+    if timelines:
+        timeline_df = pd.concat(timelines).groupby('date', as_index=False)['value'].sum()
+        timeline_df['moving_avg'] = timeline_df['value'].rolling(window=7).mean()
+    if tones:
+        tone_df = pd.concat(tones).apply(pd.to_numeric).groupby('bin', as_index=False)['count'].sum()
 
     return articles_df, timeline_df, tone_df
 
 
-def display_summary(model, keyword_input, start_date, end_date, articles_df):
-    st.markdown("<div class='container'><h3>🗑 Summary of Articles</h3></div>", unsafe_allow_html=True)
-    articles_list = [f"Title: {row['title']}, URL: {row['url']}" for _, row in articles_df.iterrows()]
-    articles_text = "\n".join(articles_list)
+def aggregate_by_term(keyword_input, start_datetime, end_datetime):
+    """
+    Query planner that fans an OR search out into one sub-query per term.
+    Each term is fetched through load_search_results, so it has its own 250-article budget and its
+    own cache entries: adding a term to a cached search only fetches the new term. Only the first
+    TERM_QUERY_MAX_TERMS canonical terms are searched, TERM_QUERY_WORKERS at a time, since every
+    term search starts its own GDELT worker threads behind the same rate limit.
+    Returns the merged (articles, timeline, tone) result and a dict of per-term results.
+    """
+    terms = canonicalize_keywords(keyword_input)[:TERM_QUERY_MAX_TERMS]
+    with ThreadPoolExecutor(max_workers=max(min(len(terms), TERM_QUERY_WORKERS), 1)) as executor:
+        futures = {
+            term: submit_in_context(executor, load_search_results, build_query(term), start_datetime, end_datetime)
+            for term in terms
+        }
+        term_results = {term: future.result() for term, future in futures.items()}
 
-    prompt = (
-        f"Summarize significant events related to the search for '{keyword_input.replace(';', ' OR ')}' "
-        f"from {start_date} to {end_date}. Here are the top articles: {articles_text}. "
-    )
+    return (*merge_term_results(term_results), term_results)
+
+
+class MaterializedResult:
+    """
+    Last fetched result of a search, kept so later refreshes only request the new data.
+    """
+
+    def __init__(self, start_datetime, end_datetime, articles_df, timeline_df, tone_df):
+        self.start_datetime = start_datetime
+        self.end_datetime = end_datetime
+        self.articles_df = articles_df
+        self.timeline_df = timeline_df
+        self.tone_df = tone_df
+        self.term_index = TermIndex()
+        self.lock = threading.Lock()
+
+    def result(self):
+        return self.articles_df.copy(), self.timeline_df.copy(), self.tone_df.copy()
 
+
+@st.cache_resource
+def get_materialized_results():
+    """
+    Return the process-wide LRU of materialized search results and the lock guarding it.
+    Entries are keyed by (query fingerprint, lookback period).
+    """
+    return OrderedDict(), threading.Lock()
+
+
+def get_term_index(query_hash, lookback_period):
+    """
+    Return the headline term index of a materialized search, or None if it has been evicted.
+    """
+    results, lock = get_materialized_results()
+    with lock:
+        state = results.get((query_hash, lookback_period))
+    return state.term_index if state is not None else None
+
+
+def to_column_timestamp(value, column):
+    """
+    Convert a window boundary to a Timestamp comparable with a datetime column (GDELT dates are UTC).
+    """
+    timestamp = pd.Timestamp(value)
+    if getattr(column.dt, 'tz', None) is not None:
+        timestamp = timestamp.tz_localize(column.dt.tz)
+    return timestamp
+
+
+def merge_timeline_delta(timeline_df, delta_df, start_datetime, covered_until):
+    """
+    Merge new timeline points in and drop points that fell out of the window.
+    GDELT picks the timeline resolution from the window length, so delta points (usually at a
+    finer resolution) are averaged into the existing series' step. The last existing bucket only
+    covered the time up to covered_until, so it is re-aggregated with the delta points that fall
+    into it, its old value weighted by the number of delta steps it already covered. Buckets are
+    only dropped once they end at or before start_datetime.
+    """
+    if timeline_df.empty:
+        return delta_df
+    timeline_df = timeline_df[['date', 'value']]
+    delta_step = delta_df['date'].diff().median() if len(delta_df) > 1 else pd.Timedelta(WINDOW_GRANULARITY)
+    step = timeline_df['date'].diff().median() if len(timeline_df) > 1 else delta_step
+    if not delta_df.empty:
+        delta_df = delta_df[['date', 'value']]
+        last_date = timeline_df['date'].max()
+        covered = max((to_column_timestamp(covered_until, timeline_df['date']) - last_date) / delta_step, 0)
+
+        points = pd.concat([
+            timeline_df[timeline_df['date'] == last_date].assign(weight=covered),
+            delta_df.assign(date=delta_df['date'].dt.floor(step), weight=1.0),
+        ], ignore_index=True)
+        points = points[points['date'] >= last_date]
+        points = points.assign(weighted=points['value'] * points['weight']).groupby('date', as_index=False)[['weighted', 'weight']].sum()
+        points = points[points['weight'] > 0]
+        merged = points.assign(value=points['weighted'] / points['weight'])[['date', 'value']]
+        timeline_df = pd.concat([timeline_df[timeline_df['date'] < last_date], merged], ignore_index=True)
+
+    timeline_df = timeline_df[timeline_df['date'] + step > to_column_timestamp(start_datetime, timeline_df['date'])]
+    timeline_df = timeline_df.reset_index(drop=True)
+    timeline_df['moving_avg'] = timeline_df['value'].rolling(window=7).mean()
+    return timeline_df
+
+
+def refresh_search_results(query, lookback_period, start_datetime, end_datetime):
+    """
+    Incrementally refresh a search.
+    The first successful run of a (query, lookback) pair fetches the whole window and materializes
+    it; later runs request articles and timeline points only for [last end, now], merge them in and
+    evict whatever fell out of the window, so refresh cost scales with new data. The tone histogram
+    cannot be split by time and is small, so it is refetched for the whole window.
+    Failed or empty results are never materialized, and a failed refresh keeps the previous state.
+    """
+    results, lock = get_materialized_results()
+    key = (query_fingerprint(query), lookback_period)
+    with lock:
+        state = results.get(key)
+        if state is not None:
+            results.move_to_end(key)
+
+    if state is None or state.end_datetime <= start_datetime or end_datetime < state.end_datetime:
+        try:
+            result = fetch_search_results(query, start_datetime, end_datetime)
+        except IncompleteResultError as e:
+            return e.result
+        if result[0].empty:
+            return result
+        state = MaterializedResult(start_datetime, end_datetime, *result)
+        with lock:
+            results[key] = state
+            while len(results) > MATERIALIZED_MAX_ENTRIES:
+                results.popitem(last=False)
+        return state.result()
+
+    with state.lock:
+        if end_datetime > state.end_datetime:
+            try:
+                articles_df, timeline_df, tone_df = aggregate_gdelt_data(
+                    query, state.end_datetime, end_datetime, strict=True, tone_start_datetime=start_datetime)
+            except IncompleteResultError:
+                return state.result()
+
+            articles_df = pd.concat([articles_df, state.articles_df], ignore_index=True)
+            articles_df = articles_df.drop_duplicates(subset='url', ignore_index=True)
+            articles_df = articles_df[articles_df['seendate'] >= to_column_timestamp(start_datetime, articles_df['seendate'])]
+            articles_df = articles_df.sort_values(['seendate', 'url'], ascending=[False, True], kind='stable')
+            state.articles_df = apply_article_schema(articles_df.head(ARTLIST_MAX_ARTICLES).reset_index(drop=True))
+            state.timeline_df = merge_timeline_delta(state.timeline_df, timeline_df, start_datetime, state.end_datetime)
+            state.tone_df = tone_df
+            state.start_datetime, state.end_datetime = start_datetime, end_datetime
+        return state.result()
+
+
+@st.cache_resource
+def get_summary_executor():
+    """
+    Worker threads that run Gemini requests, shared by all sessions.
+    """
+    return ThreadPoolExecutor(max_workers=SUMMARY_WORKERS, thread_name_prefix="gemini")
+
+
+def summary_cache_keys(query, start_date, end_date, urls, model_name):
+    """
+    Return (key, scope) for a summary: the key fingerprints everything that shapes the prompt,
+    the scope groups summaries of one query whose article sets may be compared for reuse.
+    """
+    scope = hashlib.sha256(json.dumps([query, model_name, SUMMARY_PROMPT_VERSION]).encode('utf-8')).hexdigest()
+    key = hashlib.sha256(json.dumps([scope, start_date, end_date, urls]).encode('utf-8')).hexdigest()
+    return key, scope
+
+
+def summary_cache_get(key, scope, urls):
+    """
+    Return a cached summary for the article set, or None.
+    Falls back to the most similar recent summary in the same scope when its URL set overlaps
+    by at least SUMMARY_REUSE_MIN_OVERLAP.
+    """
+    cutoff = time.time() - SUMMARY_CACHE_TTL
+    try:
+        with closing(connect_response_cache()) as conn:
+            row = conn.execute("SELECT text FROM summaries WHERE key = ? AND created >= ?", (key, cutoff)).fetchone()
+            if row is not None:
+                get_metrics()['summary_cache_lookups'].labels(result='hit').inc()
+                perf_count('summary_cache_hits')
+                return row[0]
+            candidates = []
+            if SUMMARY_REUSE_MIN_OVERLAP is not None:
+                candidates = conn.execute(
+                    "SELECT urls, text FROM summaries WHERE scope = ? AND created >= ? ORDER BY created DESC LIMIT ?",
+                    (scope, cutoff, SUMMARY_REUSE_CANDIDATES),
+                ).fetchall()
+    except sqlite3.Error:
+        return None
+
+    url_set = set(urls)
+    best_overlap, best_text = 0.0, None
+    for cached_urls, text in candidates:
+        cached_set = set(json.loads(cached_urls))
+        overlap = len(url_set & cached_set) / len(url_set | cached_set) if url_set | cached_set else 1.0
+        if overlap > best_overlap:
+            best_overlap, best_text = overlap, text
+    if best_text is not None and best_overlap >= SUMMARY_REUSE_MIN_OVERLAP:
+        get_metrics()['summary_cache_lookups'].labels(result='near_hit').inc()
+        perf_count('summary_cache_near_hits')
+        return best_text
+    get_metrics()['summary_cache_lookups'].labels(result='miss').inc()
+    return None
+
+
+def summary_cache_put(key, scope, urls, text):
+    """
+    Store a generated summary and drop expired ones.
+    """
+    now = time.time()
     try:
-        response = model.generate_content(prompt)
-        summary = response.text
+        with closing(connect_response_cache()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, scope, urls, text, created) VALUES (?, ?, ?, ?, ?)",
+                (key, scope, json.dumps(urls), text, now),
+            )
+            conn.execute("DELETE FROM summaries WHERE created < ?", (now - SUMMARY_CACHE_TTL,))
+    except sqlite3.Error:
+        pass
+
+
+def stream_summary(model, prompt, chunks, cache_entry=None):
+    """
+    Generate a summary with streaming output, putting each text chunk on the queue as it arrives.
+    An exception is put on the queue if generation fails; None always marks the end. A complete
+    summary is stored under cache_entry, a (key, scope, urls) tuple.
+    """
+    try:
+        text = ""
+        with perf_span('gemini', prompt_characters=len(prompt)) as span:
+            start = time.perf_counter()
+            for chunk in model.generate_content(prompt, stream=True):
+                if 'first_chunk_ms' not in span:
+                    span['first_chunk_ms'] = round((time.perf_counter() - start) * 1000, 1)
+                chunks.put(chunk.text)
+                text += chunk.text
+        if cache_entry is not None and text:
+            summary_cache_put(*cache_entry, text)
     except Exception as e:
-        st.error("An error occurred during summarization.")
-        summary = "Summary not available due to an error."
-    
-    st.markdown(f"<div class='summary'>{summary}</div>", unsafe_allow_html=True)
+        chunks.put(e)
+    finally:
+        chunks.put(None)
+
+
+class SummaryStream:
+    """
+    A summary being generated in the background for a placeholder on the page.
+    Streamlit elements can only be written from the script thread, so the worker queues chunks
+    and render() drains them into the placeholder once the rest of the page has been drawn.
+    """
+
+    def __init__(self, placeholder, chunks):
+        self.placeholder = placeholder
+        self.chunks = chunks
+
+    def render(self):
+        text = ""
+        while (chunk := self.chunks.get()) is not None:
+            if isinstance(chunk, Exception):
+                st.error("An error occurred during summarization.")
+                text = text or "Summary not available due to an error."
+                continue
+            text += chunk
+            self.placeholder.markdown(f"<div class='summary'>{text}▌</div>", unsafe_allow_html=True)
+        self.placeholder.markdown(f"<div class='summary'>{text}</div>", unsafe_allow_html=True)
+
+
+def strip_source_suffixes(titles, domains):
+    """
+    Remove a trailing outlet name (" - Reuters", " | AP News") from titles whose outlet matches
+    their domain (reuters.com, apnews.com). Other suffixes (" - talks collapse") are kept.
+    """
+    titles = titles.reset_index(drop=True)
+    outlets = titles.str.extract(TITLE_SOURCE_SUFFIX, expand=False).str.lower().str.replace(r"\W+", "", regex=True)
+    sites = (pd.Series(domains, dtype='string').reset_index(drop=True).fillna('').str.lower()
+             .str.replace(r"^www\d*\.", "", regex=True))
+    site_names = sites.str.split('.').str[0].fillna('')
+    sites = sites.str.replace(r"\W+", "", regex=True)
+    named = [isinstance(outlet, str) and bool(outlet) and (outlet in site or (len(name) >= 3 and outlet.startswith(name)))
+             for outlet, site, name in zip(outlets.tolist(), sites.tolist(), site_names.tolist())]
+    return titles.where(~np.array(named, dtype=bool), titles.str.replace(TITLE_SOURCE_SUFFIX, "", regex=True))
 
 
-def display_wordcloud(articles_df):
+def title_minhashes(titles, domains=None):
+    """
+    Return the MinHash signatures and shingle sets (words and adjacent word pairs) of titles,
+    with leading wire tags removed, and trailing outlet names too when the titles' domains are
+    given. Word pairs keep titles made of the same words in a different order apart. Signatures are a (titles, MINHASH_PERMUTATIONS) uint64 array; a title
+    without words gets an empty shingle set.
+    """
+    titles = titles.reset_index(drop=True) if domains is None else strip_source_suffixes(titles, domains)
+    words = (titles.str.replace(TITLE_WIRE_PREFIX, "", regex=True).str.lower().str.findall(r"\w+").tolist())
+    shingle_sets = [frozenset(title_words + [f"{a} {b}" for a, b in zip(title_words, title_words[1:])])
+                    for title_words in map(list, words)]
+    shingles = pd.Series([list(shingle_set) for shingle_set in shingle_sets], dtype=object).explode().dropna()
+    codes, unique_shingles = pd.factorize(shingles)
+    shingle_hashes = pd.util.hash_array(np.asarray(unique_shingles, dtype=object)) & np.uint64(0xFFFFFFFF)
+
+    # Universal hashing (a * x + b) mod p stands in for random permutations; a * x fits in 64 bits
+    prime = np.uint64((1 << 61) - 1)
+    rng = np.random.default_rng(0)
+    a = rng.integers(1, 1 << 32, MINHASH_PERMUTATIONS, dtype=np.uint64)
+    b = rng.integers(0, 1 << 32, MINHASH_PERMUTATIONS, dtype=np.uint64)
+    permuted = (shingle_hashes[:, None] * a + b) % prime
+    signatures = pd.DataFrame(permuted[codes]).groupby(shingles.index.to_numpy()).min()
+    signatures = signatures.reindex(range(len(titles)), fill_value=np.iinfo(np.uint64).max)
+    return signatures.to_numpy(dtype=np.uint64), shingle_sets
+
+
+def cluster_near_duplicates(signatures, shingle_sets, min_jaccard=NEAR_DUPLICATE_MIN_JACCARD):
+    """
+    Return a cluster label per title, shared by titles whose shingle sets have at least
+    min_jaccard Jaccard similarity. Candidate pairs come from MinHash signatures agreeing on a
+    whole LSH band; candidates whose signatures clearly disagree are dropped, and the rest are
+    checked against their exact shingle sets.
+    """
+    first, second = [], []
+    rows = MINHASH_PERMUTATIONS // MINHASH_BANDS
+    # Fold each band into one key; a key collision only adds a candidate that is checked later
+    mix = np.random.default_rng(1).integers(1, 1 << 63, rows, dtype=np.uint64) | np.uint64(1)
+    for band in range(MINHASH_BANDS):
+        bucket = (signatures[:, band * rows:(band + 1) * rows] * mix).sum(axis=1, dtype=np.uint64)
+        order = np.argsort(bucket, kind='stable')
+        sorted_buckets = bucket[order]
+        # Pair every title with the ones `offset` places later in its bucket
+        for offset in range(1, len(order)):
+            same_bucket = sorted_buckets[offset:] == sorted_buckets[:-offset]
+            if not same_bucket.any():
+                break
+            first.append(order[:-offset][same_bucket])
+            second.append(order[offset:][same_bucket])
+
+    parent = list(range(len(shingle_sets)))
+    if not first:
+        return np.array(parent, dtype=np.int64)
+    first, second = np.concatenate(first), np.concatenate(second)
+    keys = np.unique(np.minimum(first, second) * len(parent) + np.maximum(first, second))
+    pairs = np.column_stack([keys // len(parent), keys % len(parent)])
+    # The fraction of equal MinHashes estimates the Jaccard similarity to within a few percent
+    estimate = (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1)
+    pairs = pairs[estimate >= min_jaccard - 0.2]
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in pairs.tolist():
+        union = shingle_sets[i] | shingle_sets[j]
+        if union and len(shingle_sets[i] & shingle_sets[j]) / len(union) >= min_jaccard:
+            parent[find(i)] = find(j)
+    return np.array([find(i) for i in range(len(shingle_sets))], dtype=np.int64)
+
+
+def build_summary_prompt(keyword_input, start_date, end_date, articles_df, token_budget=SUMMARY_PROMPT_TOKEN_BUDGET):
+    """
+    Build the Gemini prompt for an article set within a token budget.
+    Near-duplicate headlines are collapsed into their most recent article with a copy count, and
+    stories are listed by copy count, then recency. If the list does not fit with URLs, URLs are
+    dropped; stories that still do not fit are left out.
+    """
+    with perf_span('summary_prompt', articles=len(articles_df)) as span:
+        articles = articles_df.reindex(columns=['title', 'url', 'seendate', 'domain']).reset_index(drop=True)
+        articles['title'] = articles['title'].astype('string').fillna('')
+        articles['cluster'] = cluster_near_duplicates(*title_minhashes(articles['title'], articles['domain']))
+        articles['copies'] = articles.groupby('cluster')['cluster'].transform('size')
+        stories = (articles.sort_values('seendate', ascending=False)
+                   .drop_duplicates('cluster')
+                   .sort_values(['copies', 'seendate'], ascending=False, kind='stable'))
+
+        copies = (" (" + stories['copies'].astype(str) + " similar articles)").where(stories['copies'] > 1, "")
+        lines = "Title: " + stories['title'] + copies
+        with_urls = lines + ", URL: " + stories['url'].astype('string')
+
+        prompt = SUMMARY_PROMPT_TEMPLATE.format(query=keyword_input.replace(';', ' OR '), start_date=start_date,
+                                                end_date=end_date, articles="")
+        budget = token_budget * SUMMARY_CHARS_PER_TOKEN - len(prompt)
+        fits = (with_urls.str.len() + 1).cumsum() <= budget
+        include_urls = bool(fits.all())
+        if not include_urls:
+            fits = (lines.str.len() + 1).cumsum() <= budget
+        listed = (with_urls if include_urls else lines)[fits.to_numpy()]
+
+        prompt = SUMMARY_PROMPT_TEMPLATE.format(query=keyword_input.replace(';', ' OR '), start_date=start_date,
+                                                end_date=end_date, articles="\n".join(listed))
+        span.update(stories=len(stories), listed=len(listed), urls=include_urls,
+                    estimated_tokens=len(prompt) // SUMMARY_CHARS_PER_TOKEN)
+        return prompt
+
+
+def display_summary(model, keyword_input, start_date, end_date, articles_df):
+    """
+    Lay out the summary section and start generating its text in the background, unless a
+    cached summary of the same (or a near-identical) article set can be shown instead.
+    Returns a SummaryStream; call render() after the charts so they do not wait for Gemini.
+    """
+    st.markdown("<div class='container'><h3>🗑 Summary of Articles</h3></div>", unsafe_allow_html=True)
+    placeholder = st.empty()
+    placeholder.markdown("<div class='summary'>Generating summary…</div>", unsafe_allow_html=True)
+    chunks = queue.Queue()
+
+    urls = sorted(set(articles_df['url'].astype(str)))
+    cache_entry = summary_cache_keys(keyword_input, start_date, end_date, urls, getattr(model, 'model_name', str(model))) + (urls,)
+    summary = summary_cache_get(*cache_entry)
+    if summary is not None:
+        chunks.put(summary)
+        chunks.put(None)
+        return SummaryStream(placeholder, chunks)
+
+    prompt = build_summary_prompt(keyword_input, start_date, end_date, articles_df)
+    submit_in_context(get_summary_executor(), stream_summary, model, prompt, chunks, cache_entry)
+    return SummaryStream(placeholder, chunks)
+
+
+def display_wordcloud(articles_df, term_index=None):
     st.markdown("<div class='container'><h3>☁️ Word Cloud of Headlines</h3></div>", unsafe_allow_html=True)
     if 'title' in articles_df.columns:
-        wordcloud = generate_wordcloud(" ".join(articles_df['title']))
-        fig, ax = plt.subplots()
-        ax.imshow(wordcloud, interpolation='bilinear')
-        ax.axis("off")
-        st.pyplot(fig)
+        st.image(generate_wordcloud(get_headline_frequencies(articles_df, term_index)))
+
+
+def title_hash(title):
+    return hashlib.sha1(title.encode('utf-8')).hexdigest()
+
+
+async def translate_missing(missing, dest):
+    """
+    Translate (title hash, title) pairs in batches on one googletrans client (its translate() is
+    a coroutine). Returns (title hash, dest, text) rows; failed batches are left out.
+    """
+    rows = []
+    async with Translator() as translator:
+        for i in range(0, len(missing), TRANSLATION_BATCH_SIZE):
+            batch = missing[i:i + TRANSLATION_BATCH_SIZE]
+            try:
+                results = await translator.translate([title for _, title in batch], dest=dest)
+                rows.extend((h, dest, result.text) for (h, _), result in zip(batch, results))
+            except Exception:
+                continue
+    return rows
 
 
-def generate_wordcloud(text):
-    translator = Translator()
+def translate_titles(titles, dest=TRANSLATION_TARGET):
+    """
+    Translate headlines through a persistent per-title cache keyed by (title hash, target language).
+    Only titles missing from the cache are sent to Google Translate, in batches; titles whose
+    translation fails are returned untranslated and not cached, so they are retried next time.
+    Returns the texts and whether every title was translated.
+    """
+    hashes = [title_hash(title) for title in titles]
+    translated = {}
     try:
-        translated_text = translator.translate(text, dest='en').text
-    except Exception as e:
-        translated_text = text
-
-    filtered_words = [word for word in translated_text.split() if len(word) > 2]
-    cleaned_text = " ".join(filtered_words)
-
-    stopwords = set(STOPWORDS)
-    wordcloud = WordCloud(
-        width=800, height=400,
-        background_color='white',
-        stopwords=stopwords,
-        collocations=False
-    ).generate(cleaned_text)
-    
-    return wordcloud
+        with closing(connect_response_cache()) as conn:
+            unique_hashes = list(set(hashes))
+            for i in range(0, len(unique_hashes), SQLITE_MAX_VARIABLES):
+                chunk = unique_hashes[i:i + SQLITE_MAX_VARIABLES]
+                rows = conn.execute(
+                    f"SELECT title_hash, text FROM translations WHERE dest = ? AND created >= ? "
+                    f"AND title_hash IN ({','.join('?' * len(chunk))})",
+                    [dest, time.time() - TRANSLATION_CACHE_TTL, *chunk],
+                )
+                translated.update(rows)
+    except sqlite3.Error:
+        pass
+
+    missing = list({h: title for h, title in zip(hashes, titles) if h not in translated}.items())
+    perf_count('translation_cache_hits', len(set(hashes)) - len(missing))
+    if missing:
+        with perf_span('translate', titles=len(missing)):
+            new_rows = asyncio.run(translate_missing(missing, dest))
+        translated.update((h, text) for h, _, text in new_rows)
+        now = time.time()
+        try:
+            with closing(connect_response_cache()) as conn, conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO translations (title_hash, dest, text, created) VALUES (?, ?, ?, ?)",
+                    [(*row, now) for row in new_rows],
+                )
+                conn.execute("DELETE FROM translations WHERE created < ?", (now - TRANSLATION_CACHE_TTL,))
+        except sqlite3.Error:
+            pass
+
+    complete = all(h in translated for h, _ in missing)
+    return [translated.get(h, title) for h, title in zip(hashes, titles)], complete
+
+
+def headline_texts(articles_df):
+    """
+    Return the article titles as a string Series aligned with articles_df, with non-English
+    titles translated, and whether every translation succeeded. English headlines are not sent
+    for translation.
+    """
+    titles = articles_df['title'].astype('string').fillna('')
+    if 'language' in articles_df.columns:
+        needs_translation = (articles_df['language'].astype(str) != 'English').to_numpy()
+    else:
+        needs_translation = np.ones(len(titles), dtype=bool)
+    complete = True
+    if needs_translation.any():
+        texts = titles.to_numpy(dtype=object)
+        translated, complete = translate_titles(texts[needs_translation].tolist())
+        texts[needs_translation] = translated
+        titles = pd.Series(texts, index=titles.index, dtype='string')
+    return titles, complete
+
+
+def extract_terms(texts):
+    """
+    Tokenize headlines in one vectorized pass: lowercase, split into words, strip possessive 's
+    and drop stopwords and short words. Returns one row per term occurrence, indexed like texts.
+    """
+    terms = pd.Series(texts, dtype='string').str.lower().str.findall(TERM_PATTERN).explode().dropna()
+    terms = terms.str.replace(r"'s$", "", regex=True)
+    return terms[(terms.str.len() >= TERM_MIN_LENGTH) & ~terms.isin(TERM_STOPWORDS)]
+
+
+def count_terms(terms):
+    """
+    Count term occurrences into a {term: count} dict for WordCloud.generate_from_frequencies.
+    Plurals are folded into their singular when both occur, as WordCloud does.
+    """
+    counts = terms.value_counts()
+    if counts.empty:
+        return {}
+    words = counts.index.astype(str)
+    singular = words.str[:-1]
+    is_plural = words.str.endswith('s') & ~words.str.endswith('ss') & singular.isin(words)
+    counts = counts.groupby(np.where(is_plural, singular, words)).sum()
+    return {term: int(count) for term, count in counts.items()}
+
+
+class TermIndex:
+    """
+    Headline terms of an article set, one row per (article URL, term occurrence).
+    Kept on a materialized search result; see update_term_index.
+    """
+
+    def __init__(self):
+        self.terms = pd.DataFrame({'url': pd.Series(dtype='string'), 'term': pd.Series(dtype='string')})
+        self.urls = pd.Index([], dtype='string')
+        self.lock = threading.Lock()
+
+
+def update_term_index(term_index, articles_df):
+    """
+    Bring a term index in line with articles_df and return its term frequencies.
+    Only headlines new to the index are translated and tokenized; terms of articles that are no
+    longer in the set are dropped. New headlines whose translation failed are counted but not
+    added, so they are translated again on the next update.
+    """
+    with term_index.lock:
+        urls = articles_df['url'].astype('string')
+        if not term_index.urls.isin(urls).all():
+            term_index.terms = term_index.terms[term_index.terms['url'].isin(urls)]
+        is_new = (~urls.isin(term_index.urls)).to_numpy()
+        perf_count('term_index_reused', int(len(urls) - is_new.sum()))
+        if is_new.any():
+            new_urls = urls[is_new].reset_index(drop=True)
+            texts, complete = headline_texts(articles_df[is_new].reset_index(drop=True))
+            terms = extract_terms(texts)
+            new_terms = pd.DataFrame({'url': new_urls.loc[terms.index].to_numpy(), 'term': terms.to_numpy()}, dtype='string')
+            if not complete:
+                term_index.urls = term_index.urls[term_index.urls.isin(urls)]
+                return count_terms(pd.concat([term_index.terms['term'], new_terms['term']]))
+            term_index.terms = pd.concat([term_index.terms, new_terms], ignore_index=True)
+        term_index.urls = pd.Index(urls.unique())
+        return count_terms(term_index.terms['term'])
+
+
+def get_headline_frequencies(articles_df, term_index=None):
+    """
+    Return the word-cloud term frequencies for an article set.
+    With a term_index (kept for incrementally refreshed searches) only headlines new to the index
+    are processed. Otherwise results are cached on disk for TERM_FREQUENCY_CACHE_TTL by a
+    fingerprint of the sorted titles and the tokenizer, so an identical article set skips
+    translation and tokenization entirely. Results with failed translations are not cached.
+    """
+    if term_index is not None:
+        return update_term_index(term_index, articles_df)
+
+    titles = articles_df['title'].fillna('').astype(str)
+    fingerprint = hashlib.sha256("\n".join(sorted(titles)).encode('utf-8'))
+    fingerprint.update(f"{TRANSLATION_TARGET}:{TERM_PATTERN}:{TERM_MIN_LENGTH}".encode('utf-8'))
+    key = fingerprint.hexdigest()
+    try:
+        with closing(connect_response_cache()) as conn:
+            row = conn.execute("SELECT body FROM term_frequencies WHERE key = ? AND created >= ?",
+                               (key, time.time() - TERM_FREQUENCY_CACHE_TTL)).fetchone()
+        if row is not None:
+            perf_count('term_frequency_cache_hits')
+            return json.loads(row[0])
+    except sqlite3.Error:
+        pass
+
+    texts, complete = headline_texts(articles_df)
+    frequencies = count_terms(extract_terms(texts))
+    if not complete:
+        return frequencies
+
+    now = time.time()
+    try:
+        with closing(connect_response_cache()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO term_frequencies (key, body, created) VALUES (?, ?, ?)",
+                (key, json.dumps(frequencies), now),
+            )
+            conn.execute(
+                "DELETE FROM term_frequencies WHERE created < ? OR key NOT IN "
+                "(SELECT key FROM term_frequencies ORDER BY created DESC LIMIT ?)",
+                (now - TERM_FREQUENCY_CACHE_TTL, TERM_FREQUENCY_CACHE_MAX_ENTRIES),
+            )
+    except sqlite3.Error:
+        pass
+    return frequencies
+
+
+@st.cache_resource
+def get_render_pool():
+    """
+    Process pool for CPU-heavy word cloud layout, shared by all sessions.
+    Spawned workers keep the layout off the script thread and out of the GIL. Workers are started
+    right away so the first search does not pay the process start-up cost.
+    """
+    pool = ProcessPoolExecutor(max_workers=WORDCLOUD_RENDER_WORKERS, mp_context=multiprocessing.get_context('spawn'))
+    for _ in range(WORDCLOUD_RENDER_WORKERS):
+        pool.submit(time.sleep, 0)
+    return pool
+
+
+@st.cache_data(max_entries=WORDCLOUD_CACHE_MAX_ENTRIES, show_spinner=False)
+def render_wordcloud_cached(cache_key, _frequencies, width, height):
+    """
+    Render a word cloud PNG in the process pool, memoized on cache_key (frequencies are not hashed).
+    """
+    with perf_span('wordcloud_layout', words=len(_frequencies)):
+        try:
+            return get_render_pool().submit(render_wordcloud_png, _frequencies, width, height).result()
+        except BrokenProcessPool:
+            get_render_pool.clear()
+            return render_wordcloud_png(_frequencies, width, height)
+
+
+def generate_wordcloud(frequencies, size=WORDCLOUD_SIZE):
+    """
+    Return the word cloud for term frequencies as PNG bytes, cached by
+    (term-frequency hash, size, stopword set).
+    """
+    fingerprint = hashlib.sha256()
+    fingerprint.update(json.dumps(frequencies, sort_keys=True).encode('utf-8'))
+    fingerprint.update(json.dumps(sorted(STOPWORDS)).encode('utf-8'))
+    cache_key = f"{fingerprint.hexdigest()}:{size[0]}x{size[1]}"
+    return render_wordcloud_cached(cache_key, frequencies, *size)
+
+def canonicalize_keywords(keyword_input):
+    """
+    Reduce semicolon-separated keywords to a canonical, sorted list of unique terms.
+    GDELT keyword matching is case-insensitive, so terms are lowercased, stripped of surrounding
+    quotes and whitespace-collapsed; empty terms and duplicates are dropped.
+    """
+    terms = set()
+    for keyword in keyword_input.split(";"):
+        term = " ".join(keyword.strip().strip('"').split()).lower()
+        if term:
+            terms.add(term)
+    return sorted(terms)
+
+
+def query_fingerprint(query):
+    """
+    Stable short hash of a built query, for use as a cache key.
+    """
+    return hashlib.sha256(query.encode('utf-8')).hexdigest()[:16]
+
+
+def normalize_query(keyword_input):
+    """
+    Return the canonical GDELT query string for the user input and its fingerprint.
+    Equivalent inputs such as "Climate Change; Global Warming" and "global warming;climate change"
+    produce the same query and fingerprint.
+    """
+    query = build_query(keyword_input)
+    return query, query_fingerprint(query)
+
 
 def build_query(keyword_input):
     """
     Build the full query string from the user input.
     If the user provides multiple keywords separated by semicolons, 
     parentheses are added only around OR'd terms.
+    Keywords are canonicalized first so equivalent searches produce identical queries.
     """
-    keywords = keyword_input.split(";")
+    keywords = canonicalize_keywords(keyword_input)
     
     # If there are multiple keywords, apply parentheses and OR logic
     if len(keywords) > 1:
-        keywords = [ensure_keyword_in_quotes(kw.strip()) for kw in keywords]
+        keywords = [ensure_keyword_in_quotes(kw) for kw in keywords]
         query = " OR ".join(keywords)
         return f"({query})"  # Wrap the OR'd terms in parentheses
     else:
         # Single keyword: no parentheses needed
-        return ensure_keyword_in_quotes(keywords[0].strip())
+        return ensure_keyword_in_quotes(keywords[0] if keywords else "")
 
 
 
@@ -286,10 +1954,41 @@ def display_tone_chart(tone_df):
             plt.grid(True)
             st.pyplot(plt)
 
+def display_term_breakdown(term_results):
+    
+    st.markdown("<div class='container'><h3>🧩 Keyword Breakdown</h3></div>", unsafe_allow_html=True)
+    with st.container(border = True):
+        breakdown = pd.DataFrame([
+            {
+                'Keyword': term,
+                'Articles': len(articles_df),
+                'Peak Volume': timeline_df['value'].max() if not timeline_df.empty else None,
+                'Tone Bins': len(tone_df),
+            }
+            for term, (articles_df, timeline_df, tone_df) in term_results.items()
+        ])
+        st.dataframe(breakdown, hide_index=True)
+
+def display_performance(perf):
+    with st.expander("⏱️ Performance", expanded=False):
+        st.dataframe(pd.DataFrame(perf.spans), hide_index=True)
+        st.json(perf.counters)
+        try:
+            cache_stats = get_cache_stats()
+        except sqlite3.Error:
+            return
+        st.caption("GDELT response cache, shared by every session on this host")
+        st.json(cache_stats)
+
 def display_article_headlines(articles_df):
     
     st.markdown("<div class='container'><h3>📰 Article Headlines</h3></div>", unsafe_allow_html=True)
     with st.container(border = True):
+        if 'memory_bytes' in articles_df.attrs:
+            st.caption(
+                f"{len(articles_df)} articles held in {articles_df.attrs['memory_bytes'] / 1024:,.0f} KB "
+                f"({articles_df.attrs['memory_savings'] / 1024:,.0f} KB saved by the typed schema)"
+            )
         for index, row in articles_df.iterrows():
             st.markdown(f"[{row['title']}]({row['url']})", unsafe_allow_html=True)
 
@@ -0,0 +1,128 @@
+"""
+Compare the JSON and CSV ingestion paths of the GDELT DOC API on recorded fixtures.
+
+Record fixtures once (against GDELT or any server BASE_URL points at), then benchmark:
+
+    python benchmarks/bench_formats.py --record "climate change" --lookback-days 30
+    python benchmarks/bench_formats.py
+
+Fixtures are stored as <mode>.json / <mode>.csv in the fixtures directory. Each
+(mode, format) pair is measured in a fresh subprocess so peak RSS is not polluted by
+earlier runs.
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+import app
+
+MODES = ['artlist', 'timelinevol', 'tonechart']
+FORMATS = ['json', 'csv']
+DEFAULT_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def record_fixtures(fixtures_dir, query, lookback_days):
+    os.makedirs(fixtures_dir, exist_ok=True)
+    end_datetime = datetime.now()
+    start_datetime = end_datetime - timedelta(days=lookback_days)
+    for mode in MODES:
+        for response_format in FORMATS:
+            params = {
+                'query': app.build_query(query),
+                'mode': mode,
+                'format': response_format,
+                'maxrecords': app.GDELT_MAX_RECORDS,
+                'STARTDATETIME': start_datetime.strftime('%Y%m%d%H%M%S'),
+                'ENDDATETIME': end_datetime.strftime('%Y%m%d%H%M%S'),
+            }
+            response = requests.get(app.BASE_URL, params=params, timeout=app.HTTP_TIMEOUT)
+            response.raise_for_status()
+            with open(os.path.join(fixtures_dir, f"{mode}.{response_format}"), "wb") as f:
+                f.write(response.content)
+            print(f"recorded {mode}.{response_format} ({len(response.content):,} bytes)")
+            time.sleep(1 / app.GDELT_RATE_PER_SECOND)
+
+
+def to_frame(body, mode, response_format):
+    data = app.parse_gdelt_response(body, mode, response_format)
+    if response_format == 'csv':
+        return data
+    return app.json_payload_to_frame(data, mode)
+
+
+def measure(fixtures_dir, mode, response_format, repeats):
+    """
+    Time body -> DataFrame for one fixture and report the peak RSS growth of this process.
+    """
+    with open(os.path.join(fixtures_dir, f"{mode}.{response_format}"), "rb") as f:
+        body = f.read()
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        frame = to_frame(body, mode, response_format)
+        timings.append(time.perf_counter() - start)
+
+    return {
+        'mode': mode,
+        'format': response_format,
+        'bytes': len(body),
+        'rows': len(frame),
+        'best_seconds': min(timings),
+        'median_seconds': sorted(timings)[len(timings) // 2],
+        'peak_rss_growth_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_rss,
+    }
+
+
+def run_benchmark(fixtures_dir, repeats):
+    results = []
+    for mode in MODES:
+        for response_format in FORMATS:
+            if not os.path.exists(os.path.join(fixtures_dir, f"{mode}.{response_format}")):
+                continue
+            output = subprocess.run(
+                [sys.executable, __file__, "--fixtures", fixtures_dir, "--repeats", str(repeats),
+                 "--measure", mode, response_format],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            results.append(json.loads(output.strip().splitlines()[-1]))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES, help="directory holding recorded fixtures")
+    parser.add_argument("--record", metavar="KEYWORDS", help="record fixtures for these keywords first")
+    parser.add_argument("--lookback-days", type=int, default=30)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--measure", nargs=2, metavar=("MODE", "FORMAT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.fixtures, *args.measure, args.repeats)))
+        return
+    if args.record:
+        record_fixtures(args.fixtures, args.record, args.lookback_days)
+
+    results = run_benchmark(args.fixtures, args.repeats)
+    if not results:
+        sys.exit(f"No fixtures found in {args.fixtures}; record some with --record")
+    print(f"{'mode':<12} {'format':<6} {'bytes':>10} {'rows':>6} {'best ms':>9} {'median ms':>10} {'peak RSS KB':>12}")
+    for result in results:
+        print(f"{result['mode']:<12} {result['format']:<6} {result['bytes']:>10,} {result['rows']:>6} "
+              f"{result['best_seconds'] * 1000:>9.2f} {result['median_seconds'] * 1000:>10.2f} "
+              f"{result['peak_rss_growth_kb']:>12,}")
+
+
+if __name__ == "__main__":
+    main()
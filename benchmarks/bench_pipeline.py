@@ -0,0 +1,235 @@
+"""
+End-to-end benchmark of the search pipeline against the offline GDELT stand-in.
+
+Drives build_query -> aggregate_gdelt_data (fetch and DataFrame prep) -> word cloud ->
+timeline and tone chart rendering for every combination of lookback period and article
+cap, and records per-stage wall time, CPU time (of the script process, and separately of the
+word cloud render pool's worker processes where /proc is available), peak traced memory and
+the number and size of allocations the stage left live, counted from tracemalloc snapshot
+statistics. Results are written as JSON, one file per commit, so runs can be compared:
+
+    python benchmarks/bench_pipeline.py --lookbacks "1 week" "1 year" --articles 250 5000
+    python benchmarks/bench_pipeline.py --compare benchmarks/results/pipeline-abc1234.json \\
+        benchmarks/results/pipeline-def5678.json
+
+Every run starts from empty on-disk caches. Timing and memory are measured in separate
+passes because tracemalloc slows the traced code down considerably.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+import app
+import gdelt_standin
+
+# Running the display functions outside `streamlit run` logs a warning per element
+logging.disable(logging.WARNING)
+
+LOOKBACKS = ['1 week', '1 month', '3 months', '6 months', '1 year']
+ARTICLE_COUNTS = [250, 1000, 5000, 50000]
+KEYWORDS = "Climate Change; Global Warming; Greenhouse Effect"
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+
+
+class PassthroughTranslator:
+    """
+    Offline replacement for googletrans.Translator (async since 4.0): returns the input untranslated.
+    """
+
+    class Result:
+        def __init__(self, text):
+            self.text = text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def translate(self, text, dest='en'):
+        if isinstance(text, list):
+            return [self.Result(item) for item in text]
+        return self.Result(text)
+
+
+def render_pool_cpu_seconds():
+    """
+    CPU time used so far by the word cloud render pool's worker processes, or None where it
+    cannot be read (the workers are never waited for, so os.times() does not include them).
+    """
+    total = 0.0
+    for pid in app.get_render_pool()._processes:
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except OSError:
+            return None
+        total += (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')  # utime + stime
+    return total
+
+
+class StageRecorder:
+    def __init__(self, trace_memory):
+        self.trace_memory = trace_memory
+        self.stages = {}
+
+    def run(self, name, fn, *args):
+        if self.trace_memory:
+            tracemalloc.start()
+            result = fn(*args)
+            _, peak = tracemalloc.get_traced_memory()
+            # Only allocations made since start() are traced, so these are the stage's live blocks
+            statistics = tracemalloc.take_snapshot().statistics('filename')
+            tracemalloc.stop()
+            self.stages.setdefault(name, {}).update({
+                'peak_bytes': peak,
+                'allocated_blocks': sum(stat.count for stat in statistics),
+                'allocated_bytes': sum(stat.size for stat in statistics),
+            })
+        else:
+            pool_start = render_pool_cpu_seconds()
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            result = fn(*args)
+            wall_seconds, cpu_seconds = time.perf_counter() - wall_start, time.process_time() - cpu_start
+            pool_end = render_pool_cpu_seconds()
+            self.stages.setdefault(name, {}).update({
+                'wall_seconds': wall_seconds,
+                'script_cpu_seconds': cpu_seconds,
+                'pool_cpu_seconds': pool_end - pool_start if pool_start is not None and pool_end is not None else None,
+            })
+        plt.close('all')
+        return result
+
+
+def reset_caches():
+    """
+    Point every on-disk cache at a fresh directory and drop in-memory caches.
+    """
+    app.CACHE_DIR = tempfile.mkdtemp(prefix="gdelt-bench-")
+    app.RESPONSE_CACHE_PATH = os.path.join(app.CACHE_DIR, "gdelt_responses.sqlite")
+    app.ARTICLE_STORE_DIR = os.path.join(app.CACHE_DIR, "articles")
+    app.st.cache_data.clear()
+
+
+def run_pipeline(recorder, lookback_period):
+    query = recorder.run('build_query', app.build_query, KEYWORDS)
+    start_datetime, end_datetime = app.get_start_date(lookback_period)
+    articles_df, timeline_df, tone_df = recorder.run('aggregate', app.aggregate_gdelt_data, query, start_datetime, end_datetime)
+    # Let the background article-store writer finish so it does not bleed into later stages
+    app.get_article_store_writer().submit(lambda: None).result()
+    recorder.run('wordcloud', app.display_wordcloud, articles_df)
+    recorder.run('timeline_chart', app.display_timeline, timeline_df)
+    recorder.run('tone_chart', app.display_tone_chart, tone_df)
+    return len(articles_df), len(timeline_df)
+
+
+def run_case(lookback_period, max_articles, trace_memory):
+    recorder = StageRecorder(trace_memory=False)
+    reset_caches()
+    app.ARTLIST_MAX_ARTICLES = max_articles
+    articles, timeline_points = run_pipeline(recorder, lookback_period)
+    if trace_memory:
+        recorder.trace_memory = True
+        reset_caches()
+        run_pipeline(recorder, lookback_period)
+    return {
+        'lookback': lookback_period,
+        'max_articles': max_articles,
+        'articles': articles,
+        'timeline_points': timeline_points,
+        'stages': recorder.stages,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(old_path, new_path):
+    with open(old_path) as f:
+        old = {(r['lookback'], r['max_articles']): r for r in json.load(f)['results']}
+    with open(new_path) as f:
+        new = json.load(f)
+    print(f"{'lookback':<10} {'articles':>8} {'stage':<15} {'old s':>9} {'new s':>9} {'ratio':>7}")
+    for result in new['results']:
+        previous = old.get((result['lookback'], result['max_articles']))
+        if previous is None:
+            continue
+        for stage, metrics in result['stages'].items():
+            old_wall = previous['stages'].get(stage, {}).get('wall_seconds')
+            new_wall = metrics.get('wall_seconds')
+            if old_wall and new_wall:
+                print(f"{result['lookback']:<10} {result['max_articles']:>8} {stage:<15} "
+                      f"{old_wall:>9.3f} {new_wall:>9.3f} {new_wall / old_wall:>7.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lookbacks", nargs="+", default=LOOKBACKS, choices=LOOKBACKS)
+    parser.add_argument("--articles", nargs="+", type=int, default=ARTICLE_COUNTS)
+    parser.add_argument("--latency-ms", type=float, default=50, help="simulated GDELT latency per request")
+    parser.add_argument("--articles-per-day", type=int, default=5000, help="stand-in article density")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--output", help="result file (default: benchmarks/results/pipeline-<commit>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two result files and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    server, base_url = gdelt_standin.start_standin(articles_per_day=args.articles_per_day, latency_ms=args.latency_ms)
+    app.BASE_URL = base_url
+    # The stand-in does not throttle, so do not let the client-side limiter dominate the timings
+    app.GDELT_RATE_PER_SECOND = 10000
+    app.GDELT_RATE_BURST = 10000
+    app.Translator = PassthroughTranslator
+    # Start the word cloud workers up front, as main() does on page load
+    app.get_render_pool().submit(int).result()
+
+    results = []
+    for lookback_period in args.lookbacks:
+        for max_articles in args.articles:
+            result = run_case(lookback_period, max_articles, trace_memory=not args.no_memory)
+            results.append(result)
+            stages = ", ".join(f"{name} {metrics['wall_seconds']:.3f}s" for name, metrics in result['stages'].items())
+            print(f"{lookback_period:<9} {max_articles:>6} articles ({result['articles']} fetched): {stages}")
+    server.shutdown()
+
+    commit = git_commit()
+    output = args.output or os.path.join(RESULTS_DIR, f"pipeline-{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({
+            'commit': commit,
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'config': {'latency_ms': args.latency_ms, 'articles_per_day': args.articles_per_day, 'keywords': KEYWORDS},
+            'results': results,
+        }, f, indent=2)
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""
+Local stand-in for the GDELT DOC 2.0 API, for offline benchmarking and testing.
+
+Serves artlist, timelinevol, timelinevolraw, tonechart, timelinelang and
+timelinesourcecountry in JSON or CSV, either from recorded fixtures (<mode>.<format>
+files, as written by bench_formats.py --record) or from deterministic synthetic
+generators. Latency, error injection and 429 throttling are configurable.
+
+    python benchmarks/gdelt_standin.py --port 8765 --latency-ms 150 --rate-limit 5
+    GDELT_BASE_URL=http://127.0.0.1:8765/api/v2/doc/doc streamlit run app.py
+"""
+import argparse
+import csv
+import hashlib
+import io
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+API_PATH = "/api/v2/doc/doc"
+DATE_FORMAT = '%Y%m%dT%H%M%SZ'
+LANGUAGES = ['English', 'Spanish', 'French', 'German', 'Chinese', 'Arabic']
+COUNTRIES = ['United States', 'United Kingdom', 'India', 'France', 'Germany', 'China', 'Brazil']
+WORDS = ['climate', 'summit', 'warming', 'emissions', 'record', 'heat', 'policy', 'energy', 'carbon',
+         'storm', 'flood', 'drought', 'leaders', 'agreement', 'report', 'scientists', 'global', 'crisis']
+TIMELINE_STEPS = {'15min': timedelta(minutes=15), 'hour': timedelta(hours=1), 'day': timedelta(days=1)}
+
+
+class StandinConfig:
+    def __init__(self, articles_per_day=500, latency_ms=0, jitter_ms=0, error_rate=0.0,
+                 rate_limit=None, fixtures_dir=None, seed=0):
+        self.articles_per_day = articles_per_day
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit  # requests per second per client, None for unlimited
+        self.fixtures_dir = fixtures_dir
+        self.seed = seed
+
+
+def query_seed(query, seed):
+    return int(hashlib.sha256(f"{seed}:{query}".encode('utf-8')).hexdigest()[:8], 16)
+
+
+def parse_window(params):
+    end_datetime = datetime.strptime(params['ENDDATETIME'], '%Y%m%d%H%M%S') if 'ENDDATETIME' in params else datetime.now(timezone.utc).replace(tzinfo=None)
+    start_datetime = (datetime.strptime(params['STARTDATETIME'], '%Y%m%d%H%M%S') if 'STARTDATETIME' in params
+                      else end_datetime - timedelta(days=90))
+    return start_datetime, end_datetime
+
+
+def generate_articles(query, start_datetime, end_datetime, max_records, config):
+    """
+    Articles sit on a fixed time grid anchored at the epoch, so overlapping or bisected
+    windows return the same articles (with the same URLs) for the same query.
+    """
+    interval = 86400 / config.articles_per_day
+    epoch = datetime(1970, 1, 1)
+    first = int((start_datetime - epoch).total_seconds() // interval) + 1
+    last = int((end_datetime - epoch).total_seconds() // interval)
+    base = query_seed(query, config.seed)
+    articles = []
+    for k in range(last, max(first, last - max_records + 1) - 1, -1):
+        rng = random.Random(base ^ k)
+        domain = f"news{k % 97}.example.com"
+        articles.append({
+            'url': f"https://{domain}/{base:x}/{k}",
+            'url_mobile': '',
+            'title': " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 12))).capitalize(),
+            'seendate': (epoch + timedelta(seconds=k * interval)).strftime(DATE_FORMAT),
+            'socialimage': f"https://{domain}/img/{k}.jpg",
+            'domain': domain,
+            'language': rng.choice(LANGUAGES),
+            'sourcecountry': rng.choice(COUNTRIES),
+        })
+    return articles
+
+
+def timeline_resolution(start_datetime, end_datetime):
+    # GDELT uses 15-minute steps below 72 hours, hourly steps up to a week and daily steps beyond
+    span = end_datetime - start_datetime
+    if span < timedelta(hours=72):
+        return '15min'
+    return 'hour' if span <= timedelta(weeks=1) else 'day'
+
+
+def timeline_dates(start_datetime, end_datetime):
+    step = TIMELINE_STEPS[timeline_resolution(start_datetime, end_datetime)]
+    current = datetime.min + ((start_datetime - datetime.min) // step) * step
+    dates = []
+    while current < end_datetime:
+        dates.append(current)
+        current += step
+    return dates
+
+
+def generate_timeline(query, mode, start_datetime, end_datetime, config):
+    base = query_seed(query, config.seed)
+    dates = timeline_dates(start_datetime, end_datetime)
+    if mode == 'timelinelang':
+        series_names = LANGUAGES
+    elif mode == 'timelinesourcecountry':
+        series_names = COUNTRIES
+    else:
+        series_names = ['Volume Intensity' if mode == 'timelinevol' else 'Article Count']
+
+    timeline = []
+    for series in series_names:
+        data = []
+        for date in dates:
+            rng = random.Random(f"{base}:{series}:{date.isoformat()}")
+            point = {'date': date.strftime(DATE_FORMAT)}
+            if mode == 'timelinevolraw':
+                point['value'] = rng.randint(0, config.articles_per_day)
+                point['norm'] = rng.randint(50000, 150000)
+            else:
+                point['value'] = round(rng.uniform(0, 2), 4)
+            data.append(point)
+        timeline.append({'series': series, 'data': data})
+    return timeline
+
+
+def generate_tonechart(query, start_datetime, end_datetime, config):
+    rng = random.Random(query_seed(query, config.seed))
+    days = max((end_datetime - start_datetime).total_seconds() / 86400, 1 / 96)
+    total = config.articles_per_day * days
+    weights = [2.718 ** (-((tone + 1.5) ** 2) / 8) for tone in range(-10, 11)]
+    scale = total / sum(weights)
+    return [{'bin': tone, 'count': int(weight * scale * rng.uniform(0.8, 1.2)), 'toparts': []}
+            for tone, weight in zip(range(-10, 11), weights)]
+
+
+def to_csv(mode, payload):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if mode == 'artlist':
+        writer.writerow(['URL', 'MobileURL', 'Date', 'Title', 'SharingImage', 'Domain', 'Language', 'SourceCountry'])
+        for article in payload.get('articles', []):
+            writer.writerow([article['url'], article['url_mobile'], article['seendate'], article['title'],
+                             article['socialimage'], article['domain'], article['language'], article['sourcecountry']])
+    elif mode == 'tonechart':
+        writer.writerow(['Bin', 'Count'])
+        for row in payload['tonechart']:
+            writer.writerow([row['bin'], row['count']])
+    else:
+        writer.writerow(['Date', 'Series', 'Value'])
+        for series in payload['timeline']:
+            for point in series['data']:
+                writer.writerow([point['date'], series['series'], point['value']])
+    return buffer.getvalue().encode('utf-8-sig')
+
+
+def build_response(params, config):
+    """
+    Return (status, content type, body) for a DOC API request.
+    """
+    mode = params.get('mode', 'artlist').lower()
+    response_format = params.get('format', 'html').lower()
+    response_format = 'csv' if response_format == 'csv' else 'json'
+    content_type = 'text/csv; charset=utf-8' if response_format == 'csv' else 'application/json; charset=utf-8'
+
+    if config.fixtures_dir:
+        path = os.path.join(config.fixtures_dir, f"{mode}.{response_format}")
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                return 200, content_type, f.read()
+
+    query = params.get('query', '')
+    if not query:
+        return 200, 'text/html', b"Please specify a query."
+    start_datetime, end_datetime = parse_window(params)
+    if mode == 'artlist':
+        max_records = min(int(params.get('maxrecords', 75)), 250)
+        articles = generate_articles(query, start_datetime, end_datetime, max_records, config)
+        payload = {'articles': articles} if articles else {}
+    elif mode in ('timelinevol', 'timelinevolraw', 'timelinelang', 'timelinesourcecountry'):
+        payload = {'query_details': {'title': query, 'date_resolution': timeline_resolution(start_datetime, end_datetime)},
+                   'timeline': generate_timeline(query, mode, start_datetime, end_datetime, config)}
+    elif mode == 'tonechart':
+        payload = {'tonechart': generate_tonechart(query, start_datetime, end_datetime, config)}
+    else:
+        return 200, 'text/html', f"Invalid mode '{mode}'.".encode('utf-8')
+
+    if response_format == 'csv':
+        return 200, content_type, to_csv(mode, payload)
+    return 200, content_type, json.dumps(payload).encode('utf-8')
+
+
+class ClientThrottle:
+    """
+    Fixed one-second window request counter per client address.
+    """
+
+    def __init__(self, rate_limit):
+        self.rate_limit = rate_limit
+        self.windows = {}
+        self.lock = threading.Lock()
+
+    def allow(self, client):
+        if not self.rate_limit:
+            return True
+        second = int(time.time())
+        with self.lock:
+            window_second, count = self.windows.get(client, (second, 0))
+            if window_second != second:
+                window_second, count = second, 0
+            self.windows[client] = (window_second, count + 1)
+            return count < self.rate_limit
+
+
+def make_handler(config):
+    throttle = ClientThrottle(config.rate_limit)
+
+    class StandinHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path != API_PATH:
+                return self.respond(404, 'text/plain', b"Not found")
+            params = {key.upper() if key.upper() in ('STARTDATETIME', 'ENDDATETIME') else key.lower(): values[-1]
+                      for key, values in parse_qs(url.query).items()}
+
+            delay = config.latency_ms + random.uniform(0, config.jitter_ms)
+            if delay:
+                time.sleep(delay / 1000)
+            if not throttle.allow(self.client_address[0]):
+                return self.respond(429, 'text/plain', b"Please limit requests to one every 5 seconds",
+                                    {'Retry-After': '1'})
+            if config.error_rate and random.random() < config.error_rate:
+                return self.respond(500, 'text/plain', b"Injected error")
+            self.respond(*build_response(params, config))
+
+        def respond(self, status, content_type, body, headers=None):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return StandinHandler
+
+
+def start_standin(host='127.0.0.1', port=0, **options):
+    """
+    Start the stand-in on a daemon thread and return (server, base URL for app.BASE_URL).
+    """
+    server = ThreadingHTTPServer((host, port), make_handler(StandinConfig(**options)))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}{API_PATH}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--articles-per-day", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 500")
+    parser.add_argument("--rate-limit", type=int, help="requests per second per client before answering 429")
+    parser.add_argument("--fixtures", help="serve <mode>.<format> files from this directory when present")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = StandinConfig(args.articles_per_day, args.latency_ms, args.jitter_ms, args.error_rate,
+                           args.rate_limit, args.fixtures, args.seed)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(config))
+    print(f"GDELT stand-in serving on http://{args.host}:{args.port}{API_PATH}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app
+
+
+class PrefixTranslator:
+    """
+    Offline stand-in for googletrans.Translator (an async client since 4.0) that marks every
+    title as translated.
+    """
+
+    class Result:
+        def __init__(self, text):
+            self.text = text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def translate(self, text, dest='en'):
+        return [self.Result(f"translated {item}") for item in text]
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(app, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(app, "RESPONSE_CACHE_PATH", str(tmp_path / "gdelt_responses.sqlite"))
+    monkeypatch.setattr(app, "Translator", PrefixTranslator)
+
+
+@pytest.fixture
+def gdelt_standin(monkeypatch):
+    """
+    Point the app at a local GDELT stand-in without a rate limit; returns the server's config.
+    """
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+    from gdelt_standin import start_standin
+
+    server, base_url = start_standin()
+    monkeypatch.setattr(app, "BASE_URL", base_url)
+    monkeypatch.setattr(app, "GDELT_RATE_PER_SECOND", 1000.0)
+    monkeypatch.setattr(app, "GDELT_RATE_BURST", 1000)
+    yield server
+    server.shutdown()
@@ -0,0 +1,75 @@
+import pandas as pd
+
+import app
+from conftest import PrefixTranslator
+
+
+def articles(rows):
+    return pd.DataFrame(rows, columns=['url', 'title', 'language'])
+
+
+def test_headline_texts_translates_when_every_title_is_foreign():
+    articles_df = articles([
+        ('https://a.example/1', 'Cumbre climática en Dubái', 'Spanish'),
+        ('https://b.example/2', 'Sommet climatique à Dubaï', 'French'),
+    ])
+
+    texts, complete = app.headline_texts(articles_df)
+
+    assert complete
+    assert texts.tolist() == ['translated Cumbre climática en Dubái', 'translated Sommet climatique à Dubaï']
+
+
+def test_headline_texts_without_language_column_translates_everything():
+    articles_df = pd.DataFrame({'url': ['https://a.example/1'], 'title': ['Cumbre climática']})
+
+    texts, complete = app.headline_texts(articles_df)
+
+    assert complete
+    assert texts.tolist() == ['translated Cumbre climática']
+
+
+def test_term_index_update_with_single_new_foreign_article():
+    term_index = app.TermIndex()
+    english = articles([('https://a.example/1', 'Climate summit opens', 'English')])
+    assert app.update_term_index(term_index, english) == {'climate': 1, 'summit': 1, 'opens': 1}
+
+    grown = pd.concat([english, articles([('https://b.example/2', 'Cumbre climática', 'Spanish')])],
+                      ignore_index=True)
+    frequencies = app.update_term_index(term_index, grown)
+
+    assert frequencies == {'climate': 1, 'summit': 1, 'opens': 1, 'translated': 1, 'cumbre': 1, 'climática': 1}
+    assert sorted(term_index.urls) == ['https://a.example/1', 'https://b.example/2']
+
+
+def test_translations_are_cached_and_not_sent_again(monkeypatch):
+    sent = []
+
+    class CountingTranslator(PrefixTranslator):
+        async def translate(self, text, dest='en'):
+            sent.extend(text)
+            return await super().translate(text, dest)
+
+    monkeypatch.setattr(app, 'Translator', CountingTranslator)
+    titles = ['Cumbre climática en Dubái', 'Sommet climatique à Dubaï']
+
+    first, complete = app.translate_titles(titles)
+    second, _ = app.translate_titles(titles)
+
+    assert complete
+    assert first == second == ['translated Cumbre climática en Dubái', 'translated Sommet climatique à Dubaï']
+    assert sent == titles
+
+
+def test_failed_translations_are_retried(monkeypatch):
+    class FailingTranslator(PrefixTranslator):
+        async def translate(self, text, dest='en'):
+            raise ConnectionError("translation service unavailable")
+
+    monkeypatch.setattr(app, 'Translator', FailingTranslator)
+    texts, complete = app.translate_titles(['Cumbre climática'])
+    assert not complete and texts == ['Cumbre climática']
+
+    monkeypatch.setattr(app, 'Translator', PrefixTranslator)
+    texts, complete = app.translate_titles(['Cumbre climática'])
+    assert complete and texts == ['translated Cumbre climática']
@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+import app
+
+
+END = datetime(2024, 10, 23, 12)
+LOOKBACK = timedelta(weeks=1)
+
+
+def test_refreshed_timeline_matches_a_fresh_fetch(gdelt_standin):
+    query = 'climate refresh timeline'
+    app.refresh_search_results(query, '1 week', END - LOOKBACK, END)
+    later = END + timedelta(minutes=15)
+
+    _, timeline_df, _ = app.refresh_search_results(query, '1 week', later - LOOKBACK, later)
+    _, fresh_df, _ = app.aggregate_gdelt_data(query, later - LOOKBACK, later)
+
+    assert timeline_df['date'].tolist() == fresh_df['date'].tolist()
+    # The last bucket is averaged from the 15-minute delta, every earlier one is GDELT's own point
+    pd.testing.assert_series_equal(timeline_df['value'].iloc[:-1], fresh_df['value'].iloc[:-1])
+    pd.testing.assert_series_equal(timeline_df['moving_avg'].iloc[:-7], fresh_df['moving_avg'].iloc[:-7])
+
+
+def test_refresh_adds_new_articles_and_evicts_old_ones(gdelt_standin):
+    query = 'climate refresh articles'
+    app.refresh_search_results(query, '1 week', END - LOOKBACK, END)
+    later = END + timedelta(minutes=15)
+
+    articles_df, _, _ = app.refresh_search_results(query, '1 week', later - LOOKBACK, later)
+    delta_df = app.fetch_articles_sharded(query, END, later)
+
+    assert set(delta_df['url']) <= set(articles_df['url'])
+    assert articles_df['seendate'].min() >= app.to_column_timestamp(later - LOOKBACK, articles_df['seendate'])
+    assert len(articles_df) <= app.ARTLIST_MAX_ARTICLES
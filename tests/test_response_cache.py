@@ -0,0 +1,15 @@
+import app
+
+
+def test_cache_stats_count_lookups_once():
+    app.cache_put('key', 'artlist', b'body')
+
+    assert app.cache_get('key', 'artlist') == b'body'
+    assert app.cache_get('missing', 'artlist') is None
+    assert app.cache_get('missing', 'artlist', allow_stale=True) is None
+
+    stats = app.get_cache_stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['entries'] == 1
+    assert stats['bytes'] == len(b'body')
@@ -0,0 +1,29 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+import app
+
+
+START = datetime(2024, 10, 23, 12)
+
+
+def test_short_windows_are_not_split_below_the_minimum_shard():
+    assert app.split_window(START, START + timedelta(minutes=15), 4) == [(START, START + timedelta(minutes=15))]
+    assert app.split_window(START, START + timedelta(minutes=10), 4) == [(START, START + timedelta(minutes=10))]
+    assert len(app.split_window(START, START + timedelta(minutes=40), 4)) == 2
+    assert len(app.split_window(START, START + timedelta(days=1), 4)) == 4
+
+
+def test_refresh_sized_window_is_one_artlist_request(monkeypatch):
+    requests = []
+
+    def fake_frame(query, mode, start_datetime, end_datetime):
+        requests.append((start_datetime, end_datetime))
+        return pd.DataFrame({'url': [f'https://a.example/{i}' for i in range(app.GDELT_MAX_RECORDS)],
+                             'seendate': '20241023T120000Z'})
+
+    monkeypatch.setattr(app, 'query_gdelt_frame', fake_frame)
+    app.fetch_articles_sharded('climate', START, START + timedelta(minutes=15))
+
+    assert requests == [(START, START + timedelta(minutes=15))]
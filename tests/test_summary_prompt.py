@@ -0,0 +1,73 @@
+import pandas as pd
+
+import app
+
+
+def clusters(titles, domain='news.example'):
+    titles = pd.Series(titles, dtype='string')
+    domains = pd.Series([domain] * len(titles), dtype='string') if isinstance(domain, str) else pd.Series(domain)
+    return app.cluster_near_duplicates(*app.title_minhashes(titles, domains)).tolist()
+
+
+def test_source_suffixes_and_wire_tags_are_collapsed():
+    labels = clusters([
+        'Climate summit opens in Paris',
+        'Climate summit opens in Paris - Reuters',
+        'Climate summit opens in Paris | AP News',
+        'UPDATE 2-Climate summit opens in Paris',
+        'Stocks fall as oil prices climb',
+    ], domain=['lemonde.fr', 'reuters.com', 'apnews.com', 'www.reuters.com', 'reuters.com'])
+
+    assert len(set(labels[:4])) == 1
+    assert labels[4] != labels[0]
+
+
+def test_one_word_edit_of_a_long_headline_is_collapsed():
+    labels = clusters([
+        'World leaders agree to phase down coal at climate talks in Glasgow',
+        'World leaders agree to phase out coal at climate talks in Glasgow',
+    ])
+
+    assert labels[0] == labels[1]
+
+
+def test_different_stories_with_shared_words_stay_apart():
+    labels = clusters([
+        'Climate summit opens in Paris',
+        'Climate summit closes in Paris',
+        'Paris summit opens climate in',
+        'Paris climate summit - talks collapse',
+        'Paris climate summit - deal reached',
+    ])
+
+    assert len(set(labels)) == 5
+
+
+def test_prompt_lists_syndicated_copies_once():
+    articles_df = pd.DataFrame({
+        'title': ['Climate summit opens in Paris - Reuters', 'Climate summit opens in Paris | AP News',
+                  'Stocks fall as oil prices climb'],
+        'url': ['https://a.example/1', 'https://b.example/2', 'https://c.example/3'],
+        'seendate': pd.to_datetime(['2024-01-01 10:00', '2024-01-01 11:00', '2024-01-01 12:00']),
+        'domain': ['reuters.com', 'apnews.com', 'ft.com'],
+    })
+
+    prompt = app.build_summary_prompt('climate', '2024-01-01', '2024-01-02', articles_df)
+
+    assert 'Title: Climate summit opens in Paris | AP News (2 similar articles), URL: https://b.example/2' in prompt
+    assert 'Reuters' not in prompt
+    assert 'Title: Stocks fall as oil prices climb, URL: https://c.example/3' in prompt
+
+
+def test_prompt_keeps_stories_that_differ_only_after_a_dash():
+    articles_df = pd.DataFrame({
+        'title': ['Paris climate summit - talks collapse', 'Paris climate summit - deal reached'],
+        'url': ['https://a.example/1', 'https://b.example/2'],
+        'seendate': pd.to_datetime(['2024-01-01 10:00', '2024-01-01 11:00']),
+        'domain': ['reuters.com', 'apnews.com'],
+    })
+
+    prompt = app.build_summary_prompt('climate', '2024-01-01', '2024-01-02', articles_df)
+
+    assert 'similar articles' not in prompt
+    assert 'talks collapse' in prompt and 'deal reached' in prompt
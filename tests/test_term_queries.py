@@ -0,0 +1,33 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+import app
+
+
+def test_term_searches_are_capped_and_bounded(monkeypatch):
+    queries = []
+    running, peak = [0], [0]
+    lock = threading.Lock()
+
+    def fake_search(query, start_datetime, end_datetime):
+        with lock:
+            queries.append(query)
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+
+    monkeypatch.setattr(app, 'load_search_results', fake_search)
+    keywords = ";".join(f"term {i}" for i in range(20))
+    end = datetime(2024, 10, 23, 12)
+
+    *_, term_results = app.aggregate_by_term(keywords, end - timedelta(days=1), end)
+
+    assert list(term_results) == app.canonicalize_keywords(keywords)[:app.TERM_QUERY_MAX_TERMS]
+    assert len(queries) == app.TERM_QUERY_MAX_TERMS
+    assert peak[0] <= app.TERM_QUERY_WORKERS
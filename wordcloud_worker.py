@@ -0,0 +1,22 @@
+"""
+Word cloud rendering for the dashboard's process pool.
+
+Kept out of app.py so worker processes can import it without re-running the
+Streamlit script.
+"""
+import io
+
+from wordcloud import WordCloud
+
+
+def render_wordcloud_png(frequencies, width, height):
+    """
+    Lay out a word cloud from term frequencies and return it as PNG bytes.
+    """
+    wordcloud = WordCloud(
+        width=width, height=height,
+        background_color='white',
+    ).generate_from_frequencies(frequencies)
+    buffer = io.BytesIO()
+    wordcloud.to_image().save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue()